@@ -1,149 +1,232 @@
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog
 import os
+import sys
 import subprocess
+import threading
+import time
 import webbrowser
 from datetime import datetime
 
+# Shared theme values, reused by every widget
+FONT_TITLE = ('Arial', 16, 'bold')
+FONT_LAUNCH = ('Arial', 14, 'bold')
+FONT_HDR = ('Arial', 12, 'bold')
+FONT_BTN_BOLD = ('Arial', 11, 'bold')
+FONT_BTN = ('Arial', 10)
+FONT_BTN_SMALL_BOLD = ('Arial', 10, 'bold')
+FONT_SMALL = ('Arial', 9)
+FONT_MONO = ('Consolas', 9)
+FONT_MONO_LARGE = ('Consolas', 10)
+BG_DARK = "#2b2b2b"
+BG_PANEL = "#3b3b3b"
+BG_TEXT = "#1e1e1e"
+
+HELP_TEXT = """
+🎮 Minecraft Server & Discord Bot Manager Help
+
+🚀 QUICK LAUNCH:
+• Main Launcher: Opens the main interface selector
+• Bot GUI: Opens Discord bot management only
+• Combined: Opens server + bot in one interface
+• Standard: Runs original console mode
+
+📁 FILE MANAGEMENT:
+• Bot Folder: Opens the bot directory in Explorer
+• Edit .env: Edit bot configuration file
+• Edit bot.py: Edit the bot script
+• Server Folder: Opens Minecraft server directory
+
+🔧 TOOLS:
+• Command Prompt: Opens CMD in bot directory
+• Python Shell: Opens Python interpreter
+• View Logs: Opens server log file
+• Restart Bot: Attempts to restart the Discord bot
+
+📊 STATUS:
+Shows the status of all important files and components
+
+💡 TIPS:
+- Double-click any .bat file to run it directly
+- Use the status checker to verify everything is working
+- The main launcher gives you the most options
+"""
+
 class FileManagerGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("🎮 Minecraft Server & Discord Bot Manager")
         self.root.geometry("600x700")
-        self.root.configure(bg="#2b2b2b")
+        self.root.configure(bg=BG_DARK)
         self.root.resizable(False, False)
         
         self.bot_dir = r"E:\pessoal\Bot Discord"
+        self.server_dir = r"F:\server mine atm102\atm10 2"
+        self.log_file = os.path.join(self.server_dir, "logs", "latest.log")
+        
+        # Resolve the windowless interpreter once instead of searching PATH per launch
+        pythonw = os.path.join(os.path.dirname(sys.executable), "pythonw.exe")
+        self._py = pythonw if os.path.isfile(pythonw) else sys.executable
+        self._script_paths = {name: os.path.join(self.bot_dir, name)
+                              for name in ("discord_bot_gui.py", "start.py", "bot.py")}
+        
+        # Files checked by the status panel, names pre-normalized once
+        self._files_to_check = [(os.path.normcase(name), description) for name, description in (
+            ("bot.py", "Discord Bot Script"),
+            ("launcher.py", "Main Launcher"),
+            ("server_gui.py", "Server GUI"),
+            ("discord_bot_gui.py", "Bot GUI"),
+            (".env", "Configuration File")
+        )]
+        self._bot_dir_names = None  # Cached entry names from one scandir pass
+        self._python_version = None  # Cached status line, the interpreter doesn't change
+        self._status_busy = False  # True while a background status refresh is running
+        self._help_window = None  # Built on first use, then hidden/shown
+        self._last_snapshot = None  # Directory mtimes seen by the last status refresh
+        self.status_refresh_interval = 5000  # 5 seconds
+        self._bot_proc = None  # Popen handle of the bot we launched
+        self._bot_restarting = False
+        self._pending_bot_exit = []  # Bot processes we are waiting on during a restart
         
         self.setup_ui()
         
+        # First status refresh runs once the window is up so it doesn't delay the first paint
+        self.root.after_idle(self.update_status)
+        
+        # Keep the status panel current without manual clicks
+        self.root.after(self.status_refresh_interval, self._tick)
+        
+    def setup_styles(self):
+        """Register the themed widget styles used by setup_ui"""
+        self.style = ttk.Style(self.root)
+        self.style.theme_use('clam')  # Native themes ignore button background colors
+        
+        self.style.configure("Section.TLabelframe", background=BG_PANEL, bordercolor="#555555")
+        self.style.configure("Section.TLabelframe.Label", background=BG_PANEL, foreground="white", font=FONT_HDR)
+        
+        self.style.configure("TButton", foreground="white", borderwidth=0, justify="center")
+        self.style.configure("Launch.TButton", font=FONT_LAUNCH, padding=(0, 12))
+        self.style.configure("Alt.TButton", font=FONT_SMALL, padding=(0, 1))
+        self.style.configure("Tool.TButton", font=FONT_BTN)
+        self.style.configure("Status.TButton", font=FONT_BTN_SMALL_BOLD)
+        self.style.configure("Help.TButton", font=FONT_BTN_BOLD, foreground="black")
+        self.style.configure("Danger.TButton", font=FONT_BTN_BOLD)
+        self._color_styles = set()
+        
+    def button_style(self, base, color):
+        """Return a '<color>.<base>' style, registering it on first use"""
+        name = f"{color.lstrip('#')}.{base}"
+        if name not in self._color_styles:
+            self.style.configure(name, background=color)
+            # Keep the color when hovered/pressed instead of clam's grey
+            self.style.map(name, background=[('pressed', color), ('active', color)])
+            self._color_styles.add(name)
+        return name
+        
     def setup_ui(self):
+        self.setup_styles()
+        
         # Main title
         title_label = tk.Label(self.root, text="🎮 Minecraft Server & Discord Bot Manager", 
-                              bg="#2b2b2b", fg="white", 
-                              font=('Arial', 16, 'bold'))
+                              bg=BG_DARK, fg="white", 
+                              font=FONT_TITLE)
         title_label.pack(pady=20)
         
         # Quick Launch Section
-        quick_frame = tk.LabelFrame(self.root, text="🚀 Quick Launch", 
-                                   bg="#3b3b3b", fg="white", 
-                                   font=('Arial', 12, 'bold'))
+        quick_frame = ttk.LabelFrame(self.root, text="🚀 Quick Launch", style="Section.TLabelframe")
         quick_frame.pack(fill="x", padx=20, pady=10)
         
         # Single main launch button
-        launch_btn = tk.Button(quick_frame, 
-                              text="🎮 Launch Server Manager\n(Complete Interface)", 
-                              command=self.launch_combined,
-                              bg="#4CAF50", fg="white", 
-                              font=('Arial', 14, 'bold'),
-                              width=30, height=3,
-                              relief="flat", bd=0)
+        launch_btn = ttk.Button(quick_frame, 
+                               text="🎮 Launch Server Manager\n(Complete Interface)", 
+                               command=self.launch_combined,
+                               style=self.button_style("Launch.TButton", "#4CAF50"),
+                               width=30)
         launch_btn.pack(pady=15)
         
         # Alternative options (smaller)
-        alt_frame = tk.Frame(quick_frame, bg="#3b3b3b")
+        alt_frame = tk.Frame(quick_frame, bg=BG_PANEL)
         alt_frame.pack(pady=10)
         
         tk.Label(alt_frame, text="Alternative Options:", 
-                bg="#3b3b3b", fg="#888888", font=('Arial', 9)).pack()
+                bg=BG_PANEL, fg="#888888", font=FONT_SMALL).pack()
         
-        alt_buttons = tk.Frame(alt_frame, bg="#3b3b3b") 
+        alt_buttons = tk.Frame(alt_frame, bg=BG_PANEL) 
         alt_buttons.pack(pady=5)
         
-        tk.Button(alt_buttons, text="🤖 Bot Only", command=self.launch_bot_gui, 
-                 bg="#7B1FA2", fg="white", font=('Arial', 9), width=12, height=1).pack(side="left", padx=5)
-        tk.Button(alt_buttons, text="⚡ Console Mode", command=self.launch_standard, 
-                 bg="#FF9800", fg="white", font=('Arial', 9), width=12, height=1).pack(side="right", padx=5)
+        for column, (text, command, color) in enumerate([
+            ("🤖 Bot Only", self.launch_bot_gui, "#7B1FA2"),
+            ("⚡ Console Mode", self.launch_standard, "#FF9800")
+        ]):
+            ttk.Button(alt_buttons, text=text, command=command, 
+                      style=self.button_style("Alt.TButton", color), width=14).grid(row=0, column=column, padx=5)
         
         # File Management Section
-        file_frame = tk.LabelFrame(self.root, text="📁 File Management", 
-                                  bg="#3b3b3b", fg="white", 
-                                  font=('Arial', 12, 'bold'))
+        file_frame = ttk.LabelFrame(self.root, text="📁 File Management", style="Section.TLabelframe")
         file_frame.pack(fill="x", padx=20, pady=10)
         
-        # File buttons
-        file_buttons_frame = tk.Frame(file_frame, bg="#3b3b3b")
+        # File buttons, two per row
+        file_buttons_frame = tk.Frame(file_frame, bg=BG_PANEL)
         file_buttons_frame.pack(fill="x", padx=10, pady=10)
         
-        # Row 1
-        file_row1 = tk.Frame(file_buttons_frame, bg="#3b3b3b")
-        file_row1.pack(fill="x", pady=5)
-        
-        tk.Button(file_row1, text="📂 Bot Folder", command=self.open_bot_folder, 
-                 bg="#607D8B", fg="white", font=('Arial', 10), width=15).pack(side="left", padx=5)
-        tk.Button(file_row1, text="📄 Edit .env", command=self.edit_env, 
-                 bg="#795548", fg="white", font=('Arial', 10), width=15).pack(side="left", padx=5)
-        
-        # Row 2
-        file_row2 = tk.Frame(file_buttons_frame, bg="#3b3b3b")
-        file_row2.pack(fill="x", pady=5)
-        
-        tk.Button(file_row2, text="📜 Edit bot.py", command=self.edit_bot_py, 
-                 bg="#E91E63", fg="white", font=('Arial', 10), width=15).pack(side="left", padx=5)
-        tk.Button(file_row2, text="🗂️ Server Folder", command=self.open_server_folder, 
-                 bg="#3F51B5", fg="white", font=('Arial', 10), width=15).pack(side="left", padx=5)
+        file_buttons = [
+            ("📂 Bot Folder", self.open_bot_folder, "#607D8B"),
+            ("📄 Edit .env", self.edit_env, "#795548"),
+            ("📜 Edit bot.py", self.edit_bot_py, "#E91E63"),
+            ("🗂️ Server Folder", self.open_server_folder, "#3F51B5")
+        ]
+        for i, (text, command, color) in enumerate(file_buttons):
+            ttk.Button(file_buttons_frame, text=text, command=command, 
+                      style=self.button_style("Tool.TButton", color), width=17).grid(row=i // 2, column=i % 2, padx=5, pady=5, sticky="w")
         
         # Tools Section
-        tools_frame = tk.LabelFrame(self.root, text="🔧 Tools & Utilities", 
-                                   bg="#3b3b3b", fg="white", 
-                                   font=('Arial', 12, 'bold'))
+        tools_frame = ttk.LabelFrame(self.root, text="🔧 Tools & Utilities", style="Section.TLabelframe")
         tools_frame.pack(fill="x", padx=20, pady=10)
         
-        tools_buttons_frame = tk.Frame(tools_frame, bg="#3b3b3b")
+        tools_buttons_frame = tk.Frame(tools_frame, bg=BG_PANEL)
         tools_buttons_frame.pack(fill="x", padx=10, pady=10)
         
-        # Tools row 1
-        tools_row1 = tk.Frame(tools_buttons_frame, bg="#3b3b3b")
-        tools_row1.pack(fill="x", pady=5)
-        
-        tk.Button(tools_row1, text="💻 Command Prompt", command=self.open_cmd, 
-                 bg="#37474F", fg="white", font=('Arial', 10), width=18).pack(side="left", padx=3)
-        tk.Button(tools_row1, text="🐍 Python Shell", command=self.open_python, 
-                 bg="#4CAF50", fg="white", font=('Arial', 10), width=18).pack(side="left", padx=3)
-        
-        # Tools row 2
-        tools_row2 = tk.Frame(tools_buttons_frame, bg="#3b3b3b")
-        tools_row2.pack(fill="x", pady=5)
-        
-        tk.Button(tools_row2, text="📋 View Logs", command=self.view_logs, 
-                 bg="#FF5722", fg="white", font=('Arial', 10), width=18).pack(side="left", padx=3)
-        tk.Button(tools_row2, text="🔄 Restart Bot", command=self.quick_restart_bot, 
-                 bg="#9C27B0", fg="white", font=('Arial', 10), width=18).pack(side="left", padx=3)
+        tool_buttons = [
+            ("💻 Command Prompt", self.open_cmd, "#37474F"),
+            ("🐍 Python Shell", self.open_python, "#4CAF50"),
+            ("📋 View Logs", self.view_logs, "#FF5722"),
+            ("🔄 Restart Bot", self.quick_restart_bot, "#9C27B0")
+        ]
+        for i, (text, command, color) in enumerate(tool_buttons):
+            ttk.Button(tools_buttons_frame, text=text, command=command, 
+                      style=self.button_style("Tool.TButton", color), width=20).grid(row=i // 2, column=i % 2, padx=3, pady=5, sticky="w")
         
         # Status Section
-        status_frame = tk.LabelFrame(self.root, text="📊 System Status", 
-                                    bg="#3b3b3b", fg="white", 
-                                    font=('Arial', 12, 'bold'))
+        status_frame = ttk.LabelFrame(self.root, text="📊 System Status", style="Section.TLabelframe")
         status_frame.pack(fill="x", padx=20, pady=10)
         
         # Status info
         self.status_text = tk.Text(status_frame, height=8, width=60,
-                                  bg="#1e1e1e", fg="#cccccc", 
-                                  font=('Consolas', 9),
-                                  state='disabled')
+                                  bg=BG_TEXT, fg="#cccccc", 
+                                  font=FONT_MONO,
+                                  state='normal')
+        self.status_text.insert(1.0, "(loading…)")  # Placeholder until the first refresh lands
+        self.status_text.config(state='disabled')
         self.status_text.pack(padx=10, pady=10)
         
         # Update status button
-        tk.Button(status_frame, text="🔄 Update Status", 
-                 command=self.update_status,
-                 bg="#009688", fg="white", font=('Arial', 10, 'bold')).pack(pady=5)
+        ttk.Button(status_frame, text="🔄 Update Status", 
+                  command=self.refresh_status,
+                  style=self.button_style("Status.TButton", "#009688")).pack(pady=5)
         
         # Help Section
-        help_frame = tk.Frame(self.root, bg="#2b2b2b")
+        help_frame = tk.Frame(self.root, bg=BG_DARK)
         help_frame.pack(fill="x", padx=20, pady=10)
         
-        tk.Button(help_frame, text="❓ Help & Documentation", 
-                 command=self.show_help,
-                 bg="#FFC107", fg="black", font=('Arial', 11, 'bold'),
-                 width=30).pack(side="left", padx=5)
+        ttk.Button(help_frame, text="❓ Help & Documentation", 
+                  command=self.show_help,
+                  style=self.button_style("Help.TButton", "#FFC107"),
+                  width=30).pack(side="left", padx=5)
         
-        tk.Button(help_frame, text="🚪 Exit", 
-                 command=self.root.quit,
-                 bg="#f44336", fg="white", font=('Arial', 11, 'bold'),
-                 width=10).pack(side="right", padx=5)
-        
-        # Initial status update
-        self.update_status()
+        ttk.Button(help_frame, text="🚪 Exit", 
+                  command=self.root.quit,
+                  style=self.button_style("Danger.TButton", "#f44336"),
+                  width=10).pack(side="right", padx=5)
         
     def launch_bot_gui(self):
         """Launch Discord bot GUI"""
@@ -167,8 +250,9 @@ class FileManagerGUI:
         
     def run_python_script(self, script_name, args=None):
         """Run a Python script without showing console window"""
+        script_path = self._script_paths.get(script_name) or os.path.join(self.bot_dir, script_name)
         try:
-            cmd = ["pythonw.exe", script_name]  # Use pythonw.exe instead of python
+            cmd = [self._py, script_path]  # pythonw.exe next to this interpreter when available
             if args:
                 cmd.extend(args)
             
@@ -176,9 +260,9 @@ class FileManagerGUI:
                            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
             
         except FileNotFoundError:
-            # Fallback to regular python if pythonw is not found
+            # Fallback to the current interpreter if pythonw could not be started
             try:
-                cmd = ["python.exe", script_name]
+                cmd = [sys.executable, script_path]
                 if args:
                     cmd.extend(args)
                 subprocess.Popen(cmd, cwd=self.bot_dir)
@@ -198,9 +282,8 @@ class FileManagerGUI:
     def open_server_folder(self):
         """Open server folder"""
         try:
-            server_dir = r"F:\server mine atm102\atm10 2"
-            if os.path.exists(server_dir):
-                os.startfile(server_dir)
+            if os.path.exists(self.server_dir):
+                os.startfile(self.server_dir)
             else:
                 messagebox.showwarning("Warning", "Server folder not found at expected location.")
         except Exception as e:
@@ -231,141 +314,255 @@ class FileManagerGUI:
     def open_cmd(self):
         """Open command prompt in bot directory"""
         try:
-            subprocess.Popen(["cmd", "/k", f"cd /d \"{self.bot_dir}\""])
+            subprocess.Popen(["cmd", "/k"], cwd=self.bot_dir,
+                           creationflags=subprocess.CREATE_NEW_CONSOLE if hasattr(subprocess, 'CREATE_NEW_CONSOLE') else 0)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open command prompt: {e}")
             
     def open_python(self):
         """Open Python shell in bot directory"""
         try:
-            subprocess.Popen(["cmd", "/k", f"cd /d \"{self.bot_dir}\" && python"])
+            subprocess.Popen([sys.executable], cwd=self.bot_dir,
+                           creationflags=subprocess.CREATE_NEW_CONSOLE if hasattr(subprocess, 'CREATE_NEW_CONSOLE') else 0)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open Python shell: {e}")
             
     def view_logs(self):
         """View server logs"""
         try:
-            log_path = r"F:\server mine atm102\atm10 2\logs\latest.log"
-            if os.path.exists(log_path):
-                os.startfile(log_path)
+            if os.path.exists(self.log_file):
+                os.startfile(self.log_file)
             else:
                 messagebox.showwarning("Warning", "Log file not found at expected location.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to view logs: {e}")
             
     def quick_restart_bot(self):
-        """Quick restart bot (if running)"""
+        """Quick restart bot (if running) without blocking the UI"""
+        if self._bot_restarting:
+            return
         try:
-            # This is a simple implementation - you might want to enhance it
-            subprocess.run(["taskkill", "/F", "/IM", "python.exe", "/FI", f"WINDOWTITLE eq *bot.py*"], 
+            if self._bot_proc is not None and self._bot_proc.poll() is None:
+                # We started this one, so we know exactly which process to stop
+                self._bot_proc.terminate()
+                self._pending_bot_exit = [self._bot_proc]
+            else:
+                self._pending_bot_exit = self._terminate_external_bot()
+            self._bot_proc = None
+            self._bot_restarting = True
+            self._await_bot_exit(time.monotonic() + 5)  # ~5 second grace period
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to restart bot: {e}")
+            
+    def _terminate_external_bot(self):
+        """Terminate bot.py processes we didn't start, returning them for polling"""
+        try:
+            import psutil
+        except ImportError:
+            # psutil not available, fall back to the window title filter
+            subprocess.run(["taskkill", "/F", "/IM", "python.exe", "/FI", "WINDOWTITLE eq *bot.py*"], 
                           capture_output=True)
+            return []
             
-            # Wait a moment then restart
-            import time
-            time.sleep(2)
+        stopped = []
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            try:
+                cmdline = proc.info.get('cmdline') or []
+                # Only match bot.py itself, never every python.exe on the machine
+                if any(os.path.basename(arg).lower() == "bot.py" for arg in cmdline[1:]):
+                    proc.terminate()
+                    stopped.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return stopped
+        
+    @staticmethod
+    def _is_running(process):
+        """Works for both subprocess.Popen and psutil.Process handles"""
+        try:
+            if hasattr(process, 'is_running'):
+                return process.is_running()
+            return process.poll() is None
+        except Exception:
+            return False
             
-            subprocess.Popen(["python", "bot.py"], cwd=self.bot_dir)
-            messagebox.showinfo("Restart", "Bot restart attempted!")
+    def _await_bot_exit(self, deadline):
+        """Wait for the old bot to exit via root.after polling, then start a new one"""
+        running = [p for p in self._pending_bot_exit if self._is_running(p)]
+        if running and time.monotonic() < deadline:
+            self._pending_bot_exit = running
+            self.root.after(100, self._await_bot_exit, deadline)
+            return
             
+        # Anything still alive after the grace period gets killed
+        for process in running:
+            try:
+                process.kill()
+            except Exception:
+                pass
+        self._pending_bot_exit = []
+        self._bot_restarting = False
+        
+        try:
+            self._bot_proc = subprocess.Popen([sys.executable, self._script_paths["bot.py"]], cwd=self.bot_dir)
+            messagebox.showinfo("Restart", "Bot restart attempted!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to restart bot: {e}")
             
-    def update_status(self):
-        """Update system status display"""
-        self.status_text.config(state='normal')
-        self.status_text.delete(1.0, tk.END)
-        
-        status_info = "🖥️ System Status:\n\n"
-        
-        # Check files
-        files_to_check = [
-            ("bot.py", "Discord Bot Script"),
-            ("launcher.py", "Main Launcher"),
-            ("server_gui.py", "Server GUI"),
-            ("discord_bot_gui.py", "Bot GUI"),
-            (".env", "Configuration File")
-        ]
+    def get_bot_dir_names(self):
+        """Return the (normalized) names present in the bot directory, scanning it once"""
+        names = self._bot_dir_names
+        if names is None:
+            try:
+                with os.scandir(self.bot_dir) as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                names = set()
+            self._bot_dir_names = names
+        return names
+        
+    def refresh_status(self):
+        """Rescan the bot directory and update the status display"""
+        if self._status_busy:
+            return
+        self._bot_dir_names = None
+        self.update_status()
         
-        for filename, description in files_to_check:
-            file_path = os.path.join(self.bot_dir, filename)
-            if os.path.exists(file_path):
-                status_info += f"✅ {description}: Found\n"
+    def _tick(self):
+        """Periodic status refresh, skipped when nothing changed on disk"""
+        self.update_status(auto=True)
+        self.root.after(self.status_refresh_interval, self._tick)
+        
+    @staticmethod
+    def _drive_mounted(path):
+        """Check the drive letter bitmap so an offline drive doesn't stall os.stat"""
+        drive = os.path.splitdrive(path)[0]
+        if os.name != 'nt' or not drive[:1].isalpha():
+            return True
+        try:
+            import ctypes
+            drives = ctypes.windll.kernel32.GetLogicalDrives()
+        except Exception:
+            return True  # Can't tell, let the normal checks decide
+        return bool(drives & (1 << (ord(drive[0].upper()) - ord('A'))))
+        
+    def _disk_snapshot(self, server_drive=True):
+        """mtime of every directory the status depends on (None when missing)"""
+        snapshot = [server_drive]
+        paths = [self.bot_dir]
+        if server_drive:
+            paths += [self.server_dir, os.path.dirname(self.log_file)]
+        for path in paths:
+            try:
+                snapshot.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                snapshot.append(None)
+        return tuple(snapshot)
+        
+    def update_status(self, auto=False):
+        """Update system status display without blocking the Tk main loop"""
+        if self._status_busy:
+            return  # A refresh is already in flight
+        self._status_busy = True
+        
+        def worker():
+            try:
+                # Probed once per refresh, shared by the snapshot and the status text
+                server_drive = self._drive_mounted(self.server_dir)
+                # Files appearing/disappearing bump their directory's mtime
+                snapshot = self._disk_snapshot(server_drive)
+                if auto and snapshot == self._last_snapshot:
+                    status_info = None  # Nothing changed, keep the current text
+                else:
+                    if snapshot != self._last_snapshot:
+                        self._bot_dir_names = None
+                    self._last_snapshot = snapshot
+                    status_info = self._compute_status(server_drive)
+            except Exception as e:
+                status_info = f"❌ Failed to compute status: {e}"
+            try:
+                self.root.after(0, self._apply_status, status_info)
+            except RuntimeError:
+                pass  # Window was closed while we were working
+                
+        threading.Thread(target=worker, daemon=True).start()
+        
+    def _compute_status(self, server_drive=True):
+        """Gather the status text (runs off the main thread, no Tk calls here)"""
+        parts = ["🖥️ System Status:", ""]
+        
+        # Check files - one directory scan instead of a stat() per file
+        present = self.get_bot_dir_names()
+        for filename, description in self._files_to_check:
+            if filename in present:
+                parts.append(f"✅ {description}: Found")
             else:
-                status_info += f"❌ {description}: Missing\n"
+                parts.append(f"❌ {description}: Missing")
         
-        # Check server folder
-        server_dir = r"F:\server mine atm102\atm10 2"
-        if os.path.exists(server_dir):
-            status_info += f"✅ Server Folder: Found\n"
+        # Server folder and logs (skipped entirely when their drive isn't mounted)
+        if not server_drive:
+            parts.append("⚠️ Server Drive: Offline")
         else:
-            status_info += f"❌ Server Folder: Not Found\n"
-            
-        # Check log file
-        log_path = r"F:\server mine atm102\atm10 2\logs\latest.log"
-        if os.path.exists(log_path):
-            status_info += f"✅ Server Logs: Accessible\n"
-        else:
-            status_info += f"⚠️ Server Logs: Not Found\n"
-            
-        # Check Python
-        try:
-            result = subprocess.run(["python", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                status_info += f"✅ Python: {version}\n"
+            if os.path.exists(self.server_dir):
+                parts.append("✅ Server Folder: Found")
             else:
-                status_info += f"❌ Python: Not Working\n"
-        except:
-            status_info += f"❌ Python: Not Found\n"
+                parts.append("❌ Server Folder: Not Found")
+                
+            if os.path.exists(self.log_file):
+                parts.append("✅ Server Logs: Accessible")
+            else:
+                parts.append("⚠️ Server Logs: Not Found")
             
-        status_info += f"\n📁 Bot Directory: {self.bot_dir}\n"
-        status_info += f"🕒 Last Updated: {datetime.now().strftime('%H:%M:%S')}"
-        
+        # Check Python (only spawned once per session)
+        if self._python_version is None:
+            try:
+                result = subprocess.run([sys.executable, "--version"], capture_output=True, text=True, timeout=2)
+                if result.returncode == 0:
+                    version = result.stdout.strip() or result.stderr.strip()
+                    self._python_version = f"✅ Python: {version}"
+                else:
+                    self._python_version = "❌ Python: Not Working"
+            except Exception:
+                self._python_version = "❌ Python: Not Found"
+        parts.append(self._python_version)
+            
+        parts.append("")
+        parts.append(f"📁 Bot Directory: {self.bot_dir}")
+        parts.append(f"🕒 Last Updated: {datetime.now().strftime('%H:%M:%S')}")
+        return "\n".join(parts)
+        
+    def _apply_status(self, status_info):
+        """Show computed status text (main thread only)"""
+        self._status_busy = False
+        if status_info is None:
+            return
+        self.status_text.config(state='normal')
+        self.status_text.delete(1.0, tk.END)
         self.status_text.insert(1.0, status_info)
         self.status_text.config(state='disabled')
         
     def show_help(self):
         """Show help information"""
-        help_text = """
-🎮 Minecraft Server & Discord Bot Manager Help
-
-🚀 QUICK LAUNCH:
-• Main Launcher: Opens the main interface selector
-• Bot GUI: Opens Discord bot management only
-• Combined: Opens server + bot in one interface
-• Standard: Runs original console mode
-
-📁 FILE MANAGEMENT:
-• Bot Folder: Opens the bot directory in Explorer
-• Edit .env: Edit bot configuration file
-• Edit bot.py: Edit the bot script
-• Server Folder: Opens Minecraft server directory
-
-🔧 TOOLS:
-• Command Prompt: Opens CMD in bot directory
-• Python Shell: Opens Python interpreter
-• View Logs: Opens server log file
-• Restart Bot: Attempts to restart the Discord bot
-
-📊 STATUS:
-Shows the status of all important files and components
-
-💡 TIPS:
-- Double-click any .bat file to run it directly
-- Use the status checker to verify everything is working
-- The main launcher gives you the most options
-        """
-        
+        # Reuse the window built on the first click
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+            
         help_window = tk.Toplevel(self.root)
         help_window.title("Help & Documentation")
         help_window.geometry("500x600")
-        help_window.configure(bg="#2b2b2b")
+        help_window.configure(bg=BG_DARK)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)  # Hide instead of destroy
         
-        help_text_widget = tk.Text(help_window, bg="#1e1e1e", fg="#cccccc", 
-                                  font=('Consolas', 10), wrap=tk.WORD)
+        help_text_widget = tk.Text(help_window, bg=BG_TEXT, fg="#cccccc", 
+                                  font=FONT_MONO_LARGE, wrap=tk.WORD)
         help_text_widget.pack(fill="both", expand=True, padx=10, pady=10)
-        help_text_widget.insert(1.0, help_text)
+        help_text_widget.insert(1.0, HELP_TEXT)
         help_text_widget.config(state='disabled')
+        
+        self._help_window = help_window
 
 def main():
     root = tk.Tk()
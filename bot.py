@@ -10,7 +10,7 @@ Features:
 - Real-time server status monitoring with automatic updates every 30 seconds
 - Automatic status message posting and updating in Discord channels
 - External server connectivity testing (internal and external domains)  
-- Force server status checks via trigger file system
+- Force server status checks via a local socket (trigger file fallback)
 - Player count and online status tracking
 - Server log monitoring for player join/leave events
 - Comprehensive error handling and connection management
@@ -30,8 +30,15 @@ Repository: https://github.com/yourusername/minecraft-server-manager
 """
 
 import signal
+import mmap
+import stat
+import re
+import bisect
+import json
 import threading
-from datetime import datetime
+import logging
+from logging.handlers import RotatingFileHandler
+from collections import Counter
 import sys
 
 import os
@@ -40,9 +47,10 @@ import discord
 import asyncio
 from mcstatus import JavaServer
 
-# Ensure stdout is unbuffered for real-time output
-sys.stdout.reconfigure(line_buffering=True)
-sys.stderr.reconfigure(line_buffering=True)
+try:
+    from watchfiles import awatch  # inotify / ReadDirectoryChangesW file events
+except ImportError:
+    awatch = None  # Fall back to polling the log once per second
 
 load_dotenv()
 TOKEN = os.getenv("TOKEN")  # Bot token from .env
@@ -50,38 +58,67 @@ CHANNEL_ID = int(os.getenv("CHANNEL_ID"))  # Discord channel ID from .env
 SERVER_IP = os.getenv("SERVER_IP")  # Minecraft server IP from .env
 SERVER_PORT = 25565  # Default port, can be changed in code if needed
 LOG_FILE = os.getenv("MINECRAFT_LOG_FILE")  # Log file path from .env
-
+FORCE_CHECK_PORT = int(os.getenv("FORCE_CHECK_PORT", "25580"))  # Local port the GUI pings to force a check
+FORCE_CHECK_FILE = "force_server_check.trigger"  # Fallback when the GUI can't reach the port
+TAIL_STATE_FILE = "tail_state.json"  # Where the log tail resumes after a bot restart
+SHUTDOWN_GRACE = 2.0  # Seconds a Ctrl+C waits for the offline edit before exiting regardless
+
+# Console output plus a rotating bot.log; set LOG_LEVEL=DEBUG in .env for connection details
+log = logging.getLogger("mcsm")
+log.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s", "%Y-%m-%d %H:%M:%S"))
+_file_handler = RotatingFileHandler("bot.log", maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+log.addHandler(_console_handler)
+log.addHandler(_file_handler)
+
+# Byte patterns for the startup scan, run directly over the mmapped log
+JOIN_RE = re.compile(rb": ([^ \n]+) joined the game")
+LEAVE_RE = re.compile(rb": ([^ \n]+) left the game")
+BOUNDARY_RE = re.compile(rb"Done \(|Stopping server")  # Server start / stop
+# Every raw line the tail loop reacts to, classified by match.lastgroup from a single search
+EVENT_RE = re.compile(rb": (?P<name>[^ ]+) (?P<player>joined|left) the game"
+                      rb"|(?P<start>Done \((?!.*For help))"
+                      rb"|(?P<stop>Stopping server)")
+
+
+# Status embeds are built once and reused; they are never modified after this
+OFFLINE_EMBED = discord.Embed(title="Minecraft Server Status", description="🔴 Offline", color=discord.Color.red())
+CHECKING_EMBED = discord.Embed(title="Minecraft Server Status", description="Checking...", color=discord.Color.greyple())
+ONLINE_EMBED = discord.Embed(title="Minecraft Server Status", description="🟢 Online", color=discord.Color.green())
 
 intents = discord.Intents.default()
 intents.message_content = True  # Enable message content intent
 
 class StatusBot(discord.Client):
-    def set_offline_status(self):
-        if self.status_message and self.loop and not self.loop.is_closed():
-            try:
-                embed = discord.Embed(
-                    title="Minecraft Server Status",
-                    description="🔴 Offline",
-                    color=discord.Color.red()
-                )
-                fut = asyncio.run_coroutine_threadsafe(self.status_message.edit(embed=embed), self.loop)
-                fut.result(timeout=5)
-                print("[INFO] Status marked as offline before closing.")
-            except asyncio.TimeoutError:
-                print("[ERROR] Timeout when marking status offline.")
-            except Exception as e:
-                print(f"[ERROR] Failed to mark status offline: {type(e).__name__}: {e}")
-        else:
-            print("[WARN] Could not mark offline - loop closed or message unavailable.")
+    async def mark_offline(self):
+        """Show the offline embed, at most once per shutdown."""
+        global last_embed_state
+        save_tail_state()
+        if self._offline_marked:
+            return
+        if not self.status_message:
+            log.warning("Could not mark offline - status message unavailable.")
+            return
+        try:
+            await self.status_message.edit(embed=OFFLINE_EMBED)
+            self._offline_marked = True
+            last_embed_state = (False, ())  # Keep the embed writer from repeating the edit
+            log.info("Status marked as offline before closing.")
+        except Exception as e:
+            log.error("Failed to mark status offline: %s: %s", type(e).__name__, e)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.status_message = None
+        self._offline_marked = False
 
     async def on_ready(self):
-        print(f"Connected as {self.user}")
+        log.info("Connected as %s", self.user)
         channel = self.get_channel(CHANNEL_ID)
         if channel is None:
-            print(f"Error: Could not find channel with ID {CHANNEL_ID}. Check if the bot has access to the channel.")
+            log.error("Could not find channel with ID %s. Check if the bot has access to the channel.", CHANNEL_ID)
             return
 
         message_id_path = "status_message_id.txt"
@@ -93,293 +130,448 @@ class StatusBot(discord.Client):
                 try:
                     message_id = int(f.read().strip())
                     message = await channel.fetch_message(message_id)
-                    print(f"[INFO] Editing existing message: {message_id}")
+                    log.info("Editing existing message: %s", message_id)
                 except Exception as e:
-                    print(f"[WARN] Could not fetch previous message: {e}")
+                    log.warning("Could not fetch previous message: %s", e)
 
         # If not found, send a new message and save its ID
         if message is None:
-            embed = discord.Embed(
-                title="Minecraft Server Status",
-                description="Checking...",
-                color=discord.Color.greyple()
-            )
-            message = await channel.send(embed=embed)
+            message = await channel.send(embed=CHECKING_EMBED)
             with open(message_id_path, "w") as f:
                 f.write(str(message.id))
-            print(f"[INFO] New message sent: {message.id}")
+            log.info("New message sent: %s", message.id)
 
         self.status_message = message
 
+        global status_changed, last_embed_state
+        last_embed_state = None  # Whatever the message shows now, it isn't our last state
+        if status_changed is None:
+            status_changed = asyncio.Event()
+        self.loop.create_task(embed_writer(message))
+
         # Start both tasks
         self.loop.create_task(watch_logs(message))
         self.loop.create_task(poll_status(message))
 
     async def close(self):
         # Set status to offline before closing
-        if self.status_message:
-            try:
-                embed = discord.Embed(
-                    title="Minecraft Server Status",
-                    description="🔴 Offline",
-                    color=discord.Color.red()
-                )
-                await self.status_message.edit(embed=embed)
-                print("[INFO] Status marked as offline before closing.")
-            except Exception as e:
-                print(f"[ERROR] Failed to mark status offline: {e}")
+        await self.mark_offline()
         await super().close()
 
 # Shared state
 server_online = False
 players_online = set()
-last_update_time = 0  # Track last update time to prevent rate limiting
+sorted_players = ()  # players_online in display order, kept in step by the helpers below
+placeholder_players = frozenset()  # Made-up entries ("N Players") standing in for hidden names, never saved
+tail_offset = None  # (dev, inode, offset) of the last complete log line read
+status_changed = None  # asyncio.Event set by producers, created in on_ready
+last_embed_state = None  # (online, players) shown by the status message
+EMBED_DEBOUNCE = 2  # Seconds to let a burst of events settle before editing
+
+def set_players(names, placeholder=False):
+    """Replace the online player list; placeholder marks names that aren't real players."""
+    global sorted_players, placeholder_players
+    players_online.clear()
+    players_online.update(names)
+    sorted_players = tuple(sorted(players_online))
+    placeholder_players = frozenset(players_online) if placeholder else frozenset()
+
+def add_player(name):
+    global sorted_players
+    if name not in players_online:
+        players_online.add(name)
+        players = list(sorted_players)
+        bisect.insort(players, name)
+        sorted_players = tuple(players)
+
+def remove_player(name):
+    global sorted_players
+    if name in players_online:
+        players_online.discard(name)
+        sorted_players = tuple(player for player in sorted_players if player != name)
+
+def mark_status_changed():
+    """Ask the embed writer to publish the current state."""
+    if status_changed is not None:
+        status_changed.set()
+
+async def embed_writer(message):
+    """Publish the latest status once per burst of changes instead of once per event."""
+    while True:
+        await status_changed.wait()
+        await asyncio.sleep(EMBED_DEBOUNCE)
+        # Cleared after the wait so changes made during it go out in this edit
+        status_changed.clear()
+        try:
+            await update_embed(message)
+        except discord.HTTPException as e:
+            if e.status == 429:
+                retry_after = float(e.response.headers.get("Retry-After", 5))
+                log.warning("Rate limited by Discord, retrying in %ss", retry_after)
+                await asyncio.sleep(retry_after)
+                status_changed.set()
+            else:
+                log.error("Failed to update status message: %s", e)
+        except Exception as e:
+            log.error("Failed to update status message: %s: %s", type(e).__name__, e)
 
 async def update_embed(message):
     """Update the Discord embed with current status."""
-    global last_update_time
+    global last_embed_state
     
-    # Rate limiting: minimum 2 seconds between updates
-    import time
-    current_time = time.time()
-    if current_time - last_update_time < 2:
-        return  # Skip update if too soon
+    # Nothing observable changed since the last edit, skip the API call
+    state = (server_online, sorted_players)
+    if state == last_embed_state:
+        return
     
-    last_update_time = current_time
-    
-    if server_online:
-        embed = discord.Embed(
-            title="Minecraft Server Status",
-            description="🟢 Online",
-            color=discord.Color.green()
-        )
-        embed.add_field(name="Players", value=f"{len(players_online)}: {', '.join(players_online) if players_online else 'None'}", inline=False)
+    online, players = state
+    if online:
+        embed = ONLINE_EMBED.copy()  # Only the players field differs between edits
+        embed.add_field(name="Players", value=f"{len(players)}: {', '.join(players) or 'None'}", inline=False)
     else:
-        embed = discord.Embed(
-            title="Minecraft Server Status",
-            description="🔴 Offline",
-            color=discord.Color.red()
-        )
+        embed = OFFLINE_EMBED
     await message.edit(embed=embed)
+    last_embed_state = state
+
+def scan_log(path):
+    """Find the last server start/stop in the log and the joins/leaves after it.
+
+    Returns (online, sessions): sessions counts joins minus leaves per player, and
+    online is None if the log has no start/stop line.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None, Counter()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            state = None
+            start = 0
+            for match in BOUNDARY_RE.finditer(mm):
+                line_start = mm.rfind(b"\n", 0, match.start()) + 1
+                line_end = mm.find(b"\n", match.end())
+                line = mm[line_start:line_end if line_end != -1 else len(mm)]
+                if match.group() == b"Stopping server":
+                    state = False
+                elif b"For help" not in line:
+                    state = True
+                else:
+                    continue
+                # Players from before a restart don't count
+                start = line_end if line_end != -1 else len(mm)
+            sessions = Counter(m.group(1).decode("utf-8", errors="replace") for m in JOIN_RE.finditer(mm, start))
+            sessions.subtract(m.group(1).decode("utf-8", errors="replace") for m in LEAVE_RE.finditer(mm, start))
+    return state, sessions
+
+def save_tail_state():
+    """Remember how far the log was read so the next start can resume there."""
+    if tail_offset is None:
+        return
+    dev, inode, offset = tail_offset
+    try:
+        with open(TAIL_STATE_FILE, "w") as f:
+            json.dump({"dev": dev, "inode": inode, "offset": offset,
+                       "players": [player for player in sorted_players if player not in placeholder_players],
+                       "server_online": server_online}, f)
+    except OSError as e:
+        log.warning("Could not save log position: %s", e)
+
+def load_tail_state(path):
+    """Return the saved tail state if it still belongs to the current log, else None."""
+    try:
+        with open(TAIL_STATE_FILE, "r") as f:
+            state = json.load(f)
+        st = os.stat(path)
+        if (state["dev"], state["inode"]) == (st.st_dev, st.st_ino) and 0 <= state["offset"] <= st.st_size:
+            return state
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+async def log_changes(path):
+    """Yield once up front, then each time the log may have changed: on file events when watchfiles is installed, else every second."""
+    yield
+    if awatch is not None:
+        target = os.path.normcase(os.path.abspath(path))
+        try:
+            # Watch the folder, not the file, so a rotated latest.log keeps being followed
+            async for _ in awatch(os.path.dirname(target),
+                                  watch_filter=lambda change, changed: os.path.normcase(changed) == target):
+                yield
+            return
+        except Exception as e:
+            log.warning("File watching unavailable, polling the log instead: %s", e)
+    while True:
+        await asyncio.sleep(1)
+        yield
+
+def is_fifo(path):
+    """True when the log is a named pipe (some server wrappers stream stdout into one)."""
+    try:
+        return stat.S_ISFIFO(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+async def tail_fifo(path):
+    """Yield raw lines written to a named pipe, woken by the event loop only when data arrives."""
+    loop = asyncio.get_running_loop()
+    # Opening read-write holds a writer end ourselves, so the pipe never hits EOF between server runs
+    fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+    chunks = asyncio.Queue()
+
+    def drain():
+        try:
+            chunks.put_nowait(os.read(fd, 65536))
+        except BlockingIOError:
+            pass
+
+    loop.add_reader(fd, drain)
+    pending = b""
+    try:
+        while True:
+            *lines, pending = (pending + await chunks.get()).split(b"\n")
+            for line in lines:
+                yield line
+    finally:
+        loop.remove_reader(fd)
+        os.close(fd)
+
+async def tail_log(path, offset=None):
+    """Yield raw (undecoded) lines appended to the log after offset (default: its current end), following truncation and rotation."""
+    global tail_offset
+    if is_fifo(path):
+        async for line in tail_fifo(path):
+            yield line
+        return
+    st = os.stat(path)
+    identity = (st.st_dev, st.st_ino)
+    pos = st.st_size if offset is None else offset
+    pending = b""
+    tail_offset = (*identity, pos)
+    async for _ in log_changes(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue  # Mid-rotation, the new file isn't there yet
+        if (st.st_dev, st.st_ino) != identity or st.st_size < pos:
+            # New or truncated log, start over from its beginning
+            identity = (st.st_dev, st.st_ino)
+            pos = 0
+            pending = b""
+        if st.st_size == pos:
+            continue
+        # The file is only held open while reading so the server can rotate it
+        with open(path, "rb") as f:
+            f.seek(pos)
+            data = f.read()
+            pos = f.tell()
+        *lines, pending = (pending + data).split(b"\n")
+        tail_offset = (*identity, pos - len(pending))
+        for line in lines:
+            yield line
 
 async def watch_logs(message):
     """Watch Minecraft server log for events."""
-    global server_online, players_online
+    global server_online
 
-    import re
-    # First, scan the log file to reconstruct online players
-    joined = []
-    left = []
-    print(f"[DEBUG] Scanning log file: {LOG_FILE}")
-    
-    try:
-        with open(LOG_FILE, "r", encoding="utf-8") as f:
-            lines_processed = 0
-            for line in f:
-                lines_processed += 1
-                # Detect player join
-                if "joined the game" in line:
-                    match = re.search(r": ([^ ]+) joined the game", line)
-                    if match:
-                        name = match.group(1)
-                        joined.append(name)
-                        print(f"[DEBUG] Found join: {name}")
-                # Detect player leave
-                if "left the game" in line:
-                    match = re.search(r": ([^ ]+) left the game", line)
-                    if match:
-                        name = match.group(1)
-                        left.append(name)
-                        print(f"[DEBUG] Found leave: {name}")
-                # Detect server start
-                if "Done (" in line and "For help" not in line:
-                    server_online = True
-                    # Clear player lists when server restarts
-                    joined.clear()
-                    left.clear()
-                    print(f"[DEBUG] Server started, cleared player lists")
-                # Detect server stopping
-                if "Stopping server" in line:
-                    server_online = False
-                    joined.clear()
-                    left.clear()
-                    print(f"[DEBUG] Server stopped, cleared player lists")
-            
-            print(f"[DEBUG] Processed {lines_processed} lines from log file")
-            print(f"[DEBUG] Total joins found: {joined}")
-            print(f"[DEBUG] Total leaves found: {left}")
-    except Exception as e:
-        print(f"[ERROR] Failed to read log file: {e}")
+    # Resume from where the previous run stopped reading, if the log wasn't rotated since
+    fifo = is_fifo(LOG_FILE)
+    saved = None if fifo else load_tail_state(LOG_FILE)
+    if saved is not None:
+        server_online = saved["server_online"]
+        set_players(saved["players"])
+        start_offset = saved["offset"]
+        log.info("Resuming log at byte %s, players: %s", start_offset, ', '.join(sorted_players) or 'None')
+    elif fifo:
+        start_offset = None
+        log.info("Log is a named pipe, following live output only")
+    else:
+        start_offset = None
+        # First, scan the log file to reconstruct online players
+        log.debug("Scanning log file: %s", LOG_FILE)
+        
+        try:
+            state, sessions = scan_log(LOG_FILE)
+            if state is not None:
+                server_online = state
+                log.debug("Last server %s found, counting players after it", 'start' if state else 'stop')
+        except Exception as e:
+            sessions = Counter()
+            log.error("Failed to read log file: %s", e)
 
-    # Reconstruct online players - better logic
-    players_online.clear()
-    player_sessions = {}
-    
-    # Count joins and leaves for each player
-    for name in joined:
-        player_sessions[name] = player_sessions.get(name, 0) + 1
-    for name in left:
-        player_sessions[name] = player_sessions.get(name, 0) - 1
-    
-    # Players with positive count are online
-    for name, count in player_sessions.items():
-        if count > 0:
-            players_online.add(name)
-    
-    print(f"[INIT] Online players detected: {', '.join(players_online) if players_online else 'None'}")
-    print(f"[DEBUG] Player sessions: {player_sessions}")
-    await update_embed(message)
+        # Players who joined more often than they left are online
+        set_players(name for name, count in sessions.items() if count > 0)
+        
+        log.info("Online players detected: %s", ', '.join(sorted_players) or 'None')
+        log.debug("Player sessions: %s", dict(sessions))
+    mark_status_changed()
 
     # Now tail the log file for new events
-    with open(LOG_FILE, "r", encoding="utf-8") as f:
-        f.seek(0, os.SEEK_END)
-        while True:
-            line = f.readline()
-            if not line:
-                await asyncio.sleep(1)
-                continue
-
-            # Only log player joins, leaves, and commands, with timestamp
-            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            if "joined the game" in line:
-                match = re.search(r": ([^ ]+) joined the game", line)
-                if match:
-                    name = match.group(1)
-                    players_online.add(name)
-                    print(f"[{now}] [LOG] {name} joined the server.")
-                    await update_embed(message)
-            elif "left the game" in line:
-                match = re.search(r": ([^ ]+) left the game", line)
-                if match:
-                    name = match.group(1)
-                    players_online.discard(name)
-                    print(f"[{now}] [LOG] {name} left the server.")
-                    await update_embed(message)
-
-            # Detect server start
-            if "Done (" in line and "For help" not in line:
-                server_online = True
-                await update_embed(message)
-
-            # Detect server stopping
-            if "Stopping server" in line:
-                server_online = False
-                players_online.clear()
-                await update_embed(message)
+    async for line in tail_log(LOG_FILE, start_offset):
+        match = EVENT_RE.search(line)
+        if not match:
+            continue
+
+        # Only log player joins, leaves, and commands, with timestamp
+        kind = match.lastgroup
+        if kind == "player":
+            # Only the player name is ever decoded
+            name = match.group("name").decode("utf-8", errors="replace")
+            if match.group("player") == b"joined":
+                add_player(name)
+                log.info("%s joined the server.", name)
+            else:
+                remove_player(name)
+                log.info("%s left the server.", name)
+            mark_status_changed()
+
+        # Detect server start
+        elif kind == "start":
+            server_online = True
+            mark_status_changed()
+
+        # Detect server stopping
+        elif kind == "stop":
+            server_online = False
+            set_players(())
+            mark_status_changed()
+
+def consume_trigger(path=FORCE_CHECK_FILE):
+    """Delete the trigger file, returning True if it existed (one syscall instead of exists + remove)."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        log.warning("Could not remove %s: %s", path, e)
+        return False
 
 async def poll_status(message):
     """Backup verification using mcstatus, runs every 5 min if logs don't detect anything."""
     global server_online
-    server = JavaServer.lookup(f"{SERVER_IP}:{SERVER_PORT}")
+    server = await JavaServer.async_lookup(f"{SERVER_IP}:{SERVER_PORT}")
     
     # Also test localhost for comparison
-    localhost_server = JavaServer.lookup(f"localhost:{SERVER_PORT}")
+    localhost_server = await JavaServer.async_lookup(f"localhost:{SERVER_PORT}")
+
+    # The GUI connects to this port to request an immediate check
+    force_check = asyncio.Event()
+
+    async def on_force_check(reader, writer):
+        force_check.set()
+        writer.close()
+
+    try:
+        await asyncio.start_server(on_force_check, "127.0.0.1", FORCE_CHECK_PORT)
+        log.info("Listening for force check requests on port %s", FORCE_CHECK_PORT)
+    except OSError as e:
+        log.warning("Could not listen on port %s (%s), only the trigger file will force checks", FORCE_CHECK_PORT, e)
 
     while True:
-        # Check for force check trigger file
-        force_check_file = "force_server_check.trigger"
-        force_check_requested = False
+        force_check_requested = force_check.is_set()
+        force_check.clear()
         
-        if os.path.exists(force_check_file):
-            try:
-                os.remove(force_check_file)
-                force_check_requested = True
-                print("[INFO] Force server check triggered by GUI")
-                sys.stdout.flush()
-            except:
-                pass
+        # Trigger file written when the GUI could not reach the port, looked at once per check
+        if consume_trigger():
+            force_check_requested = True
+        if force_check_requested:
+            log.info("Force server check triggered by GUI")
         
         external_working = False
         localhost_working = False
         
-        # Test external server
-        try:
-            print(f"[DEBUG] Trying to connect to external server: {SERVER_IP}:{SERVER_PORT}")
-            sys.stdout.flush()
-            status = server.status()
+        # Test external server and localhost together, without blocking the event loop
+        log.debug("Trying to connect to external server: %s:%s", SERVER_IP, SERVER_PORT)
+        status, localhost_status = await asyncio.gather(
+            asyncio.wait_for(server.async_status(), 5),
+            asyncio.wait_for(localhost_server.async_status(), 3),
+            return_exceptions=True
+        )
+        
+        if not isinstance(status, Exception):
             external_working = True
             server_online = True
-            print(f"[DEBUG] External server online! {status.players.online} players connected")
+            log.debug("External server online! %s players connected", status.players.online)
             
             # Update player list from external server
-            players_online.clear()
             if status.players.sample:
-                for player in status.players.sample:
-                    players_online.add(player.name)
-                print(f"[DEBUG] Player names from external server: {', '.join(players_online)}")
+                set_players(player.name for player in status.players.sample)
+                log.debug("Player names from external server: %s", ', '.join(sorted_players))
             elif status.players.online > 0:
                 # Server has players but didn't return names (server config issue)
-                print(f"[DEBUG] Server has {status.players.online} players but names not available (server hide-online-players=true?)")
-                players_online.add(f"Player 1" if status.players.online == 1 else f"{status.players.online} Players")
+                log.debug("Server has %s players but names not available (server hide-online-players=true?)", status.players.online)
+                set_players([f"Player 1" if status.players.online == 1 else f"{status.players.online} Players"], placeholder=True)
             else:
-                print(f"[DEBUG] No players online")
+                set_players(())
+                log.debug("No players online")
             
-            sys.stdout.flush()
-        except Exception as e:
-            print(f"[DEBUG] Error connecting to external server {SERVER_IP}:{SERVER_PORT}: {type(e).__name__}: {e}")
+        else:
+            e = status
+            log.debug("Error connecting to external server %s:%s: %s: %s", SERVER_IP, SERVER_PORT, type(e).__name__, e)
             
             # Provide specific error details
             error_str = str(e).lower()
-            if "timeout" in error_str:
-                print(f"[DEBUG] Timeout - server may not be externally accessible (firewall/port forwarding?)")
+            if isinstance(e, asyncio.TimeoutError) or "timeout" in error_str:
+                log.debug("Timeout - server may not be externally accessible (firewall/port forwarding?)")
             elif "connection refused" in error_str:
-                print(f"[DEBUG] Connection refused - server may be offline or port blocked")
+                log.debug("Connection refused - server may be offline or port blocked")
             elif "getaddrinfo" in error_str or "name resolution" in error_str:
-                print(f"[DEBUG] DNS error - domain {SERVER_IP} is not resolving to an IP")
-                print(f"[DEBUG] Check: 1) No-IP/DynDNS configuration 2) Internet connection 3) Valid domain")
+                log.debug("DNS error - domain %s is not resolving to an IP", SERVER_IP)
+                log.debug("Check: 1) No-IP/DynDNS configuration 2) Internet connection 3) Valid domain")
             
-        # Test localhost for comparison
-        try:
-            localhost_status = localhost_server.status()
+        # Localhost result, for comparison
+        if not isinstance(localhost_status, Exception):
             localhost_working = True
-            print(f"[DEBUG] Local server working: {localhost_status.players.online} players")
+            log.debug("Local server working: %s players", localhost_status.players.online)
             if localhost_status.players.sample:
                 local_players = [p.name for p in localhost_status.players.sample]
-                print(f"[DEBUG] Local server players: {', '.join(local_players)}")
-        except Exception as e:
-            print(f"[DEBUG] Local server also failed: {e}")
+                log.debug("Local server players: %s", ', '.join(local_players))
+        else:
+            log.debug("Local server also failed: %s: %s", type(localhost_status).__name__, localhost_status)
             
         # Set server status based on external connectivity (what players see)
         if not external_working:
             server_online = False
-            players_online.clear()
+            set_players(())
             
         # Diagnostic summary
         if localhost_working and not external_working:
-            print(f"[DEBUG] DIAGNOSIS: Server runs locally but is not externally accessible")
-            print(f"[DEBUG] Possible causes: 1) Port forwarding not configured 2) Firewall blocking 3) DNS not updated")
+            log.info("DIAGNOSIS: Server runs locally but is not externally accessible")
+            log.debug("Possible causes: 1) Port forwarding not configured 2) Firewall blocking 3) DNS not updated")
         elif not localhost_working and not external_working:
-            print(f"[DEBUG] DIAGNOSIS: Server appears to be completely offline")
+            log.info("DIAGNOSIS: Server appears to be completely offline")
         elif external_working:
-            print(f"[DEBUG] DIAGNOSIS: Everything working - server externally accessible!")
+            log.info("DIAGNOSIS: Everything working - server externally accessible!")
                 
-        await update_embed(message)
+        mark_status_changed()
         
-        # Sleep with frequent checks for force triggers if this wasn't a force check
-        if not force_check_requested:
-            # Sleep for 5 minutes, but check for force triggers every 10 seconds
-            for i in range(30):  # 30 * 10 seconds = 5 minutes
-                await asyncio.sleep(10)
-                if os.path.exists("force_server_check.trigger"):
-                    break  # Break early if force check is requested
-        else:
-            # If this was a force check, wait a bit before next regular check
-            await asyncio.sleep(30)
-
+        # Sleep for 5 minutes, or until the GUI asks for a check
+        try:
+            await asyncio.wait_for(force_check.wait(), timeout=300)
+        except asyncio.TimeoutError:
+            pass
 
 def run_bot():
     global client
     client = StatusBot(intents=intents)
 
+    shutdown_started = []
+
     def handle_exit(sig, frame):
-        print(f"[INFO] Exit signal ({sig}) received. Marking status offline...")
+        if shutdown_started:
+            os._exit(0)  # Second Ctrl+C, stop waiting
+        shutdown_started.append(sig)
+        log.info("Exit signal (%s) received. Marking status offline...", sig)
+        # Best effort: if Discord is slow (or rate limiting us) exit anyway after the grace period
+        watchdog = threading.Timer(SHUTDOWN_GRACE, os._exit, args=(0,))
+        watchdog.daemon = True
+        watchdog.start()
         try:
-            client.set_offline_status()
+            # The handler runs on the loop's own thread, so hand close() to the loop rather than
+            # blocking on it here; close() marks the status offline and lets client.run() return
+            client.loop.call_soon_threadsafe(client.loop.create_task, client.close())
+            log.info("Shutting down bot...")
         except Exception as e:
-            print(f"[ERRO] Erro durante shutdown: {type(e).__name__}: {e}")
-        finally:
-            print("[INFO] Shutting down bot...")
-            import os
+            log.error("Erro durante shutdown: %s: %s", type(e).__name__, e)
             os._exit(0)
 
     signal.signal(signal.SIGINT, handle_exit)
@@ -388,6 +580,6 @@ def run_bot():
     client.run(TOKEN)
 
 if not TOKEN:
-    print("[ERROR] TOKEN not found in environment variables. Check your .env file.")
+    log.error("TOKEN not found in environment variables. Check your .env file.")
 else:
     run_bot()
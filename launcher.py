@@ -93,41 +93,48 @@ class LauncherGUI:
                              justify="center")
         info_label.pack(side="bottom", pady=15)
         
+    def _spawn(self, script, windowless=False):
+        """Hand off to script and close the launcher (only returns by raising)"""
+        if os.name != 'nt':
+            # Replace the launcher process instead of keeping it (and Tk) alive next to the child
+            os.execv(sys.executable, [sys.executable, script])
+            
+        exe = os.path.join(os.path.dirname(sys.executable), "pythonw.exe" if windowless else "python.exe")
+        if not os.path.isfile(exe):
+            exe = sys.executable
+        if windowless:
+            subprocess.Popen([exe, script],
+                           creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                           close_fds=True, stdin=subprocess.DEVNULL,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            subprocess.Popen([exe, script],
+                           creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP,  # Visible console window
+                           close_fds=True)
+        self.root.destroy()
+        os._exit(0)  # Nothing left to clean up, skip the interpreter teardown
+        
     def launch_gui_mode(self):
         """Launch Server Manager with full GUI interface"""
         messagebox.showinfo("Launching", "Server Manager GUI will start after you click OK.\nThis launcher will then close.")
-        
         try:
-            subprocess.Popen([sys.executable.replace('python.exe', 'pythonw.exe'), "server_gui.py"],
-                           creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
-            self.root.destroy()
-            sys.exit(0)
+            self._spawn("server_gui.py", windowless=True)
         except Exception as e:
-            try:
-                subprocess.Popen([sys.executable, "server_gui.py"])
-                self.root.destroy()
-                sys.exit(0)
-            except Exception as e2:
-                messagebox.showerror("Error", f"Failed to launch Server Manager: {e2}")
+            messagebox.showerror("Error", f"Failed to launch Server Manager: {e}")
             
     def launch_bot_console(self):
         """Launch Discord bot with visible console output"""
+        messagebox.showinfo("Launching", "Discord bot will start in console mode after you click OK.\nThis launcher will then close.")
         try:
-            subprocess.Popen([sys.executable, "bot.py"], 
-                           creationflags=0)  # Visible console window
-            messagebox.showinfo("Launched", "Discord bot is starting in console mode...\nThis launcher will now close.")
-            self.root.destroy()
-            sys.exit(0)
+            self._spawn("bot.py")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to launch Discord bot console: {e}")
             
     def launch_server_console(self):
         """Launch server-only console (no GUI, no Discord bot)"""
+        messagebox.showinfo("Launching", "Server console will start after you click OK.\nThis launcher will then close.")
         try:
-            subprocess.Popen([sys.executable, "server_console.py"])
-            messagebox.showinfo("Launched", "Server console is starting...\nThis launcher will now close.")
-            self.root.destroy()
-            sys.exit(0)
+            self._spawn("server_console.py")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to launch server console: {e}")
 
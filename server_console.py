@@ -27,7 +27,8 @@ Perfect for:
 - Low-resource environments
 - Direct server command access
 
-Usage: python server_console.py
+Usage: python server_console.py [--direct]
+  --direct  Server output goes straight to the terminal (no timestamps, lowest overhead)
 """
 
 import subprocess
@@ -35,167 +36,427 @@ import sys
 import os
 import threading
 import time
-from datetime import datetime
+import selectors
+import select
+import atexit
+from enum import IntEnum
+
+# Output pipe capacity we ask for, and the most one read takes out of it: a full pipe drains in one syscall
+PIPE_SIZE = 1 << 20
+HISTORY_FILE = os.path.expanduser("~/.mc_console_history")
+PROMPT = ">>> "
+
+class ServerState(IntEnum):
+    STOPPED = 0
+    STARTING = 1
+    RUNNING = 2  # server_process is set and its pipes are open
+    STOPPING = 3
 
 class ServerConsole:
-    def __init__(self):
+    def __init__(self, direct_output=False):
         self.server_process = None
-        self.server_running = False
+        self.state = ServerState.STOPPED
         self.server_dir = r"F:\server mine atm102\atm10 2"
         self.server_jar = "neoforge-21.1.77.jar"  # Adjust as needed
+        self.jar_path = os.path.join(self.server_dir, self.server_jar)
+        self.paths_validated = False  # Set once the folder and jar were found
+        self.output_tail = b""  # Incomplete last line of server output
+        self.reader_thread = None
+        # Let the server write straight to this terminal, Python only feeds it commands
+        self.direct_output = direct_output
+        self.stdout_fd = sys.stdout.fileno()
+        self.output_lock = threading.Lock()  # One writer at a time on the terminal
+        self.reading_input = False  # input() has the prompt on screen
+        self.readline = self.setup_readline()
+        # One thread waits on keyboard and server output together (run_multiplexed), the same
+        # single-loop model as an asyncio subprocess without making every command a coroutine.
+        # Windows can't select() on pipes or the console, and readline only edits lines read
+        # through input(), so those cases keep a reader thread
+        self.multiplexed = os.name != 'nt' and self.readline is None
+        
+        # Console commands, anything else is sent to the server
+        self.commands = {
+            "quit": self.quit_console,
+            "start": self.start_server,
+            "stop": self.stop_server,
+            "restart": self.restart_server,
+            "help": self.show_help,
+            "?": self.show_help
+        }
         
         print("🎮 Minecraft Server Console")
         print("=" * 50)
         print(f"Server Directory: {self.server_dir}")
         print("Commands: start, stop, restart, <any server command>, quit")
+        if direct_output:
+            print("Direct output mode: server log goes straight to the terminal")
         print("=" * 50)
         
+    def setup_readline(self):
+        """Enable line editing, persistent history and Tab completion on an interactive POSIX terminal"""
+        if os.name == 'nt' or not sys.stdin.isatty():
+            return None
+        try:
+            import readline
+        except ImportError:
+            return None
+            
+        readline.set_completer(self.complete_command)
+        readline.parse_and_bind("tab: complete")
+        readline.set_history_length(1000)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass  # First run, no history yet
+        atexit.register(self.save_history, readline)
+        return readline
+        
+    def save_history(self, readline):
+        """Write the command history for the next session"""
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+            
+    def complete_command(self, text, state):
+        """readline completer: console command names for the first word only"""
+        if self.readline.get_begidx() > 0:
+            return None
+        matches = [name for name in self.commands if name.startswith(text.lower())]
+        return matches[state] if state < len(matches) else None
+        
     def start_server(self):
         """Start the Minecraft server"""
-        if self.server_running:
+        if self.state != ServerState.STOPPED:
             print("❌ Server is already running!")
             return
             
-        if not os.path.exists(self.server_dir):
-            print(f"❌ Server directory not found: {self.server_dir}")
-            return
-            
-        jar_path = os.path.join(self.server_dir, self.server_jar)
-        if not os.path.exists(jar_path):
-            print(f"❌ Server jar not found: {jar_path}")
+        if not self.validate_paths():
             return
             
         try:
             print("🚀 Starting Minecraft server...")
+            self.state = ServerState.STARTING
             
             # Start server process
             self.server_process = subprocess.Popen(
                 ["java", "-jar", self.server_jar, "nogui"],
                 cwd=self.server_dir,
                 stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
+                stdout=None if self.direct_output else subprocess.PIPE,  # None inherits our stdout
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0  # Raw binary pipes: no text decoding, no buffer to flush
             )
             
-            self.server_running = True
+            self.state = ServerState.RUNNING
             print("✅ Server starting... (type 'stop' to stop server, 'quit' to exit console)")
+            if self.direct_output:
+                return  # Nothing to read or timestamp, the server's own log lines carry the time
+                
+            self.enlarge_pipe(self.server_process.stdout)
             
-            # Start output reader thread
-            threading.Thread(target=self.read_server_output, daemon=True).start()
+            # Output is read by the run() loop's selector, or by a reader thread on Windows
+            self.output_tail = b""
+            if self.multiplexed:
+                os.set_blocking(self.server_process.stdout.fileno(), False)  # A read can never stall the loop
+            else:
+                self.reader_thread = threading.Thread(target=self.read_server_output, daemon=True)
+                self.reader_thread.start()
             
+        except FileNotFoundError as e:
+            self.state = ServerState.STOPPED
+            self.paths_validated = False  # Something moved, check again next time
+            print(f"❌ Failed to start server: {e}")
         except Exception as e:
+            self.state = ServerState.STOPPED
             print(f"❌ Failed to start server: {e}")
             
+    def validate_paths(self):
+        """Check the server folder and jar exist, only until they've been found once"""
+        if self.paths_validated:
+            return True
+        if not os.path.exists(self.server_dir):
+            print(f"❌ Server directory not found: {self.server_dir}")
+            return False
+        if not os.path.exists(self.jar_path):
+            print(f"❌ Server jar not found: {self.jar_path}")
+            return False
+        self.paths_validated = True
+        return True
+        
+    def enlarge_pipe(self, stream, size=PIPE_SIZE):
+        """Grow the output pipe (Linux only) so log bursts don't stall the JVM on a full pipe"""
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            import fcntl
+            fcntl.fcntl(stream.fileno(), getattr(fcntl, "F_SETPIPE_SZ", 1031), size)
+        except OSError:
+            pass  # Above /proc/sys/fs/pipe-max-size for unprivileged users, keep the default
+            
     def stop_server(self):
         """Stop the Minecraft server"""
-        if not self.server_running or not self.server_process:
+        if self.state != ServerState.RUNNING:
             print("❌ Server is not running!")
             return
             
         try:
             print("🛑 Stopping server...")
-            self.server_process.stdin.write("stop\n")
-            self.server_process.stdin.flush()
+            self.state = ServerState.STOPPING
+            self.server_process.stdin.write(b"stop\n")
             
-            # Wait for server to stop
-            self.server_process.wait(timeout=30)
-            self.server_running = False
-            print("✅ Server stopped successfully")
-            
-        except subprocess.TimeoutExpired:
+            # Wait for server to stop, its shutdown log keeps being shown meanwhile
+            if self.wait_for_exit(30) is not None:
+                self.close_output()
+                print("✅ Server stopped successfully")
+                return
+                
             print("⚠️ Server didn't stop gracefully, forcing termination...")
             self.server_process.terminate()
-            self.server_running = False
+            if self.wait_for_exit(10) is not None:
+                self.close_output()
+            self.state = ServerState.STOPPED
             print("✅ Server terminated")
         except Exception as e:
             print(f"❌ Error stopping server: {e}")
             
+    def wait_for_exit(self, timeout):
+        """Poll for the server's exit while still showing its output; returns the exit code, None on timeout"""
+        stream = self.server_process.stdout
+        eof = stream is None  # Direct output, nothing to pump
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            ret = self.server_process.poll()
+            if ret is not None:
+                return ret
+            if self.multiplexed and not eof:
+                # The run() loop is busy running this command, so pump the output from here
+                if select.select([stream], [], [], 0.05)[0]:
+                    try:
+                        chunk = os.read(stream.fileno(), PIPE_SIZE)
+                    except BlockingIOError:
+                        continue
+                    eof = not chunk
+                    self.show_output(chunk)
+            else:
+                time.sleep(0.05)  # The reader thread shows the output
+        return None
+        
+    def close_output(self):
+        """Show the rest of an exited server's output, then close the pipe"""
+        stream = self.server_process.stdout
+        if stream is not None:
+            if self.multiplexed:
+                self.drain_output(stream)
+            elif self.reader_thread:
+                self.reader_thread.join(timeout=5)  # Let it print the last lines before we report
+            stream.close()
+        self.state = ServerState.STOPPED
+        
     def send_command(self, command):
         """Send command to server"""
-        if not self.server_running or not self.server_process:
+        if self.state != ServerState.RUNNING:
             print("❌ Server is not running!")
             return
             
         try:
-            self.server_process.stdin.write(command + "\n")
-            self.server_process.stdin.flush()
+            self.server_process.stdin.write(command.encode("utf-8", "replace") + b"\n")
             print(f"💬 Command sent: {command}")
         except Exception as e:
             print(f"❌ Error sending command: {e}")
             
+    def send_commands(self, commands):
+        """Send several commands to the server in a single pipe write"""
+        if self.state != ServerState.RUNNING:
+            print("❌ Server is not running!")
+            return
+            
+        commands = list(commands)
+        try:
+            self.server_process.stdin.write(b"".join([c.encode("utf-8", "replace") + b"\n" for c in commands]))
+            print(f"💬 {len(commands)} commands sent")
+        except Exception as e:
+            print(f"❌ Error sending commands: {e}")
+            
+    def show_output(self, chunk):
+        """Display a chunk of server output; only complete lines are shown"""
+        data = self.output_tail + chunk
+        cut = data.rfind(b"\n") + 1
+        if not cut:
+            self.output_tail = data
+            return
+        self.output_tail = data[cut:]
+        
+        # Display server output with timestamp, one per chunk
+        prefix = b"[" + time.strftime("%H:%M:%S").encode() + b"] "
+        # bytes.replace() inserts the prefix after every newline in C, no per-line Python objects
+        body = data[:cut - 1].replace(b"\r", b"").replace(b"\n", b"\n" + prefix)
+        self.write_stdout(prefix + body + b"\n", redraw=True)
+        
+    def write_stdout(self, payload, redraw=False):
+        """Write bytes straight to the stdout fd, bypassing print() and the text layer"""
+        with self.output_lock:
+            if redraw and self.readline and self.reading_input:
+                # Clear the prompt line, show the output, then put the prompt and typed text back, all in one write
+                typed = self.readline.get_line_buffer().encode("utf-8", "replace")
+                payload = b"\r\x1b[K" + payload + PROMPT.encode() + typed
+            sys.stdout.flush()  # Keep ordering with anything print() still has buffered
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(self.stdout_fd, view):]
+        
+    def end_output(self):
+        """Show whatever is left once the server's output has ended"""
+        if self.output_tail:
+            self.write_stdout(self.output_tail + b"\n", redraw=True)
+            self.output_tail = b""
+        self.state = ServerState.STOPPED
+        
     def read_server_output(self):
-        """Read and display server output"""
-        while self.server_running and self.server_process:
-            try:
-                line = self.server_process.stdout.readline()
-                if not line:
+        """Read and display server output, a whole pipe chunk at a time (reader thread)"""
+        # Pipe EOF is the only stop signal; the state is reset once, by end_output()
+        try:
+            while True:
+                chunk = self.server_process.stdout.read(PIPE_SIZE)  # Raw read, returns what's available
+                if not chunk:
                     break
-                    
-                # Display server output with timestamp
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                print(f"[{timestamp}] {line.rstrip()}")
-                
-            except Exception as e:
-                print(f"❌ Error reading server output: {e}")
-                break
-                
-        self.server_running = False
+                self.show_output(chunk)
+        except ValueError:
+            pass  # close_output() gave up waiting and closed the pipe
+        except OSError as e:
+            print(f"❌ Error reading server output: {e}")
+        self.end_output()
         
     def restart_server(self):
         """Restart the server"""
         print("🔄 Restarting server...")
         self.stop_server()
-        time.sleep(3)
+        # stop_server already waited for the exit; only a forced terminate may still be in progress
+        if self.server_process and self.server_process.poll() is None:
+            try:
+                self.server_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                print("❌ Old server process is still running, not starting a new one")
+                return
         self.start_server()
         
+    def quit_console(self):
+        """Stop the server if needed and leave the console"""
+        if self.state == ServerState.RUNNING:
+            print("Stopping server before exit...")
+            self.stop_server()
+        print("👋 Goodbye!")
+        return False
+        
+    def show_help(self):
+        """Print the console commands"""
+        print("\nAvailable commands:")
+        print("  start    - Start the Minecraft server")
+        print("  stop     - Stop the Minecraft server")  
+        print("  restart  - Restart the Minecraft server")
+        print("  quit     - Exit this console")
+        print("  help     - Show this help")
+        print("  <any>    - Send command to server\n")
+        
+    def handle_command(self, user_input):
+        """Run one console command; returns False when the console should exit"""
+        if self.direct_output and self.state == ServerState.RUNNING and self.server_process.poll() is not None:
+            self.state = ServerState.STOPPED  # No output pipe to report the exit, so notice it here
+        # Console commands are all short, so longer input skips the lower() entirely.
+        # A plain dict beats a hand-rolled perfect hash here, computing the key in Python costs more than str hashing
+        handler = self.commands.get(user_input.lower()) if len(user_input) <= 7 else None
+        if handler:
+            return handler() is not False
+        if user_input:
+            # Send as server command
+            self.send_command(user_input)
+        return True
+        
     def run(self):
         """Main console loop"""
+        try:
+            if self.multiplexed:
+                self.run_multiplexed()
+            else:
+                while self.handle_command(self.read_input()):
+                    pass
+        except KeyboardInterrupt:
+            print("\n\n🛑 Ctrl+C detected. Stopping...")
+            if self.state == ServerState.RUNNING:
+                self.stop_server()
+        except EOFError:
+            pass
+            
+    def read_input(self):
+        """Read one command line, letting the reader thread know the prompt is showing"""
+        self.reading_input = True
+        try:
+            return input(PROMPT).strip()
+        finally:
+            self.reading_input = False
+            
+    def run_multiplexed(self):
+        """Wait on the keyboard and the server's output together in one thread"""
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ, "stdin")
+        watched = None  # Server stdout currently registered with the selector
+        typed = b""  # Input after the last complete line
+        encoding = sys.stdin.encoding or "utf-8"
+        sys.stdout.write(PROMPT)
+        sys.stdout.flush()
+        
         while True:
-            try:
-                user_input = input(">>> ").strip()
+            # Follow the server being started or stopped by the last command
+            current = self.server_process.stdout if self.state == ServerState.RUNNING else None
+            if current is not watched:
+                if watched is not None:
+                    sel.unregister(watched)
+                    if not watched.closed:  # stop_server already drained and closed it
+                        self.drain_output(watched)
+                if current is not None:
+                    sel.register(current, selectors.EVENT_READ, "server")
+                watched = current
                 
-                if user_input.lower() == "quit":
-                    if self.server_running:
-                        print("Stopping server before exit...")
-                        self.stop_server()
-                    print("👋 Goodbye!")
-                    break
-                    
-                elif user_input.lower() == "start":
-                    self.start_server()
+            for key, _ in sel.select():
+                if key.data == "server":
+                    try:
+                        chunk = os.read(key.fd, PIPE_SIZE)
+                    except BlockingIOError:
+                        continue  # Spurious wakeup
+                    if chunk:
+                        self.show_output(chunk)
+                    else:
+                        self.end_output()
+                else:
+                    # Straight from the fd: a buffered readline() would pull a whole pasted batch into
+                    # its buffer and leave select() thinking only the first line had arrived
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        *lines, typed = (typed + chunk).split(b"\n")
+                    else:
+                        lines, typed = [typed] if typed else [], None  # Last line without a newline
+                    for line in lines:
+                        if not self.handle_command(line.decode(encoding, "replace").strip()):
+                            return
+                        sys.stdout.write(PROMPT)
+                        sys.stdout.flush()
+                    if typed is None:
+                        raise EOFError
                     
-                elif user_input.lower() == "stop":
-                    self.stop_server()
-                    
-                elif user_input.lower() == "restart":
-                    self.restart_server()
-                    
-                elif user_input.lower() in ["help", "?"]:
-                    print("\nAvailable commands:")
-                    print("  start    - Start the Minecraft server")
-                    print("  stop     - Stop the Minecraft server")  
-                    print("  restart  - Restart the Minecraft server")
-                    print("  quit     - Exit this console")
-                    print("  help     - Show this help")
-                    print("  <any>    - Send command to server\n")
-                    
-                elif user_input:
-                    # Send as server command
-                    self.send_command(user_input)
-                    
-            except KeyboardInterrupt:
-                print("\n\n🛑 Ctrl+C detected. Stopping...")
-                if self.server_running:
-                    self.stop_server()
-                break
-            except EOFError:
+    def drain_output(self, stream):
+        """Show the output a stopped server left in its pipe"""
+        while True:
+            try:
+                chunk = os.read(stream.fileno(), PIPE_SIZE)
+            except BlockingIOError:
+                break  # Process didn't exit after terminate(), don't wait on it
+            if not chunk:
                 break
+            self.show_output(chunk)
+        self.end_output()
                 
 def main():
-    console = ServerConsole()
+    console = ServerConsole(direct_output="--direct" in sys.argv[1:])
     console.run()
     
 if __name__ == "__main__":
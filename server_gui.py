@@ -37,15 +37,136 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import subprocess
 import threading
-import queue
+import concurrent.futures
+import socket
 import time
 import os
 from datetime import datetime, timedelta
 import re
 import json
 import collections
+import itertools
 import winsound  # For system sounds on Windows
 
+try:
+    import psutil  # Process detection and performance sampling
+except ImportError:
+    psutil = None  # Those features report themselves unavailable
+
+try:
+    from watchfiles import watch as watch_files  # inotify / ReadDirectoryChangesW file events
+except ImportError:
+    watch_files = None  # Fall back to polling the log twice per second
+
+MAX_LOG_LINES = 5000  # Older lines are dropped from the log displays
+
+# Player join/leave in one pass over the line
+PLAYER_EVENT_RE = re.compile(r'(\w+) (joined|left) the game')
+
+# Discord bot process command lines, matched case-insensitively without lowercasing a copy
+BOT_CMDLINE_RE = re.compile(r'bot\.py|discord|(?<![a-z])bot(?![a-z0-9])', re.IGNORECASE)
+BOT_SCRIPT_RE = re.compile(r'bot\.py', re.IGNORECASE)
+
+# Reference values shown by the common properties dialog: (category, ((name, default, description), ...))
+COMMON_PROPERTIES = (
+    ("Basic Settings", (
+        ("server-port", "25565", "Server port (default: 25565)"),
+        ("max-players", "20", "Maximum players"),
+        ("motd", "A Minecraft Server", "Message of the day"),
+        ("difficulty", "easy", "Difficulty: peaceful, easy, normal, hard"),
+        ("gamemode", "survival", "Default gamemode: survival, creative, adventure, spectator")
+    )),
+    ("World Settings", (
+        ("level-name", "world", "World folder name"),
+        ("level-seed", "", "World seed (empty for random)"),
+        ("level-type", "minecraft\\:normal", "World type: normal, flat, largeBiomes, amplified"),
+        ("generate-structures", "true", "Generate structures (villages, dungeons, etc.)"),
+        ("spawn-protection", "16", "Spawn protection radius")
+    )),
+    ("Performance", (
+        ("view-distance", "10", "Render distance (2-32)"),
+        ("simulation-distance", "10", "Simulation distance (3-32)"),
+        ("max-tick-time", "60000", "Max tick time before server watchdog"),
+        ("entity-broadcast-range-percentage", "100", "Entity broadcast range %")
+    )),
+    ("Security", (
+        ("online-mode", "true", "Require valid Minecraft accounts"),
+        ("white-list", "false", "Enable whitelist"),
+        ("enforce-whitelist", "false", "Kick non-whitelisted players"),
+        ("op-permission-level", "4", "OP permission level (1-4)")
+    )),
+)
+
+def parse_tps(message):
+    """TPS reported by a /forge tps, /neoforge tps or Paper /tps output line, else None"""
+    if 'TPS' not in message:
+        return None
+    # Only the command's own output counts: the text after the log header has to start with the marker,
+    # so chat ("<Steve> Overall: 5 TPS") or /say lines can't fake a reading
+    body = (message.partition(']: ')[2] or message).lstrip()
+    # Fixed delimiters, so partition() does it without a regex
+    if body.startswith('Overall:'):
+        if 'Mean TPS:' in body:  # Forge: "Overall: Mean tick time: 0.969 ms. Mean TPS: 20.000"
+            tail = body.partition('Mean TPS:')[2]
+        else:  # NeoForge: "Overall: 20.000 TPS (2.519 ms/tick)"
+            tail = body.partition('Overall:')[2]
+    elif body.startswith('TPS from last'):  # Paper/Spigot: "TPS from last 1m, 5m, 15m: 20.0, 20.0, 20.0"
+        tail = body.partition(': ')[2]
+    else:
+        return None
+    try:
+        return float(tail.split()[0].rstrip(',').lstrip('*'))  # Paper marks values over 20 with '*'
+    except (ValueError, IndexError):
+        return None
+
+def newest(column, count):
+    """Iterator over the last count items of a deque, oldest first, without copying the rest"""
+    return itertools.islice(column, max(len(column) - count, 0), None)
+
+def process_cwd(proc):
+    """Working directory of a psutil process, '' when it can't be read"""
+    try:
+        return proc.cwd()
+    except psutil.AccessDenied:
+        return ''
+
+def snapshot_java_pids():
+    """PIDs of java/javaw processes from one Toolhelp32 snapshot (Windows), None elsewhere or on failure"""
+    if os.name != 'nt':
+        return None
+    import ctypes
+    from ctypes import wintypes
+    
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [("dwSize", wintypes.DWORD), ("cntUsage", wintypes.DWORD),
+                    ("th32ProcessID", wintypes.DWORD), ("th32DefaultHeapID", ctypes.c_size_t),
+                    ("th32ModuleID", wintypes.DWORD), ("cntThreads", wintypes.DWORD),
+                    ("th32ParentProcessID", wintypes.DWORD), ("pcPriClassBase", ctypes.c_long),
+                    ("dwFlags", wintypes.DWORD), ("szExeFile", ctypes.c_wchar * 260)]
+    
+    kernel32 = ctypes.WinDLL('kernel32')  # Own instance, so the prototypes below don't leak into ctypes.windll
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    
+    snapshot = kernel32.CreateToolhelp32Snapshot(0x2, 0)  # TH32CS_SNAPPROCESS: every process with its exe name
+    if snapshot is None or snapshot == wintypes.HANDLE(-1).value:
+        return None
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        pids = []
+        more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            if 'java' in entry.szExeFile.lower():
+                pids.append(entry.th32ProcessID)
+            more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return pids
+    finally:
+        kernel32.CloseHandle(snapshot)
+
 class MinecraftServerGUI:
     def __init__(self, root):
         self.root = root
@@ -56,37 +177,62 @@ class MinecraftServerGUI:
         # Server process and communication
         self.server_process = None
         self.bot_process = None
-        self.log_queue = queue.Queue()
-        self.bot_log_queue = queue.Queue()
+        # Reader thread -> Tk loop pipes; deque append/popleft are atomic and skip Queue's locking
+        self.log_queue = collections.deque(maxlen=10000)
+        self.bot_log_queue = collections.deque(maxlen=10000)
         self.server_running = False
         self.bot_running = False
         self.monitoring_external_server = False
         self.analytics_running = True  # Flag to control analytics thread
+        self.closing = threading.Event()  # Set by on_closing; wakes the analytics thread out of its wait
         
         # Server paths - update these as needed
         self.server_dir = r"F:\server mine atm102\atm10 2"
         self.log_file = r"F:\server mine atm102\atm10 2\logs\latest.log"
         self.bot_dir = r"E:\pessoal\Bot Discord"
+        self.bot_scan_cache = (float('-inf'), [])  # (monotonic time, candidates) of the last _scan_bot_candidates sweep
+        self.server_scan_cache = (float('-inf'), None)  # (monotonic time, pid) of the last cached server process scan
+        self.force_check_port = 25580  # Must match FORCE_CHECK_PORT in the bot's .env
+        self.force_check_in_flight = False
+        self.last_force_check = float('-inf')  # monotonic time of the last force check request
         
-        # Analytics data
+        # Analytics data, one column per metric (appended together by record_performance)
         self.performance_data = {
             'cpu': collections.deque(maxlen=60),  # Last 60 data points
             'memory': collections.deque(maxlen=60),
             'timestamps': collections.deque(maxlen=60),
             'tps': collections.deque(maxlen=60)
         }
-        self.player_data = {}  # {player_name: {'join_time': datetime, 'total_playtime': seconds}}
-        self.analytics_update_interval = 5000  # 5 seconds
+        # Long-horizon tier: one (start, cpu, memory, tps) average per minute, 24 hours of them
+        self.performance_minutes = collections.deque(maxlen=1440)
+        self.minute_bucket = None  # [start, cpu_sum, memory_sum, tps_sum, count] of the minute being filled
+        self.server_psutil = None  # psutil.Process of the monitored server, reused between samples
+        self.performance_samples = 0  # Samples recorded since the last clear, counted by record_performance
+        self.performance_drawn = None  # performance_samples when the history table was last drawn, None to redraw it
+        self.performance_rows = 0  # Sample rows currently in the history table
+        self.reported_tps = None  # (tps, monotonic time) from the last TPS command output in the log
+        self.label_cache = {}  # Widget path -> (text, fg) last set by _set_label
+        self.flashing = {}  # Widget path -> color to restore, for labels flash_label has turned red
+        self.uptime_shown = None  # Whole seconds of uptime the uptime label was last drawn with
+        self.player_data = {}  # {player_name: {'join_time': monotonic seconds while online, 'total_playtime': seconds}}
+        self.analytics_update_interval = 250  # ms between checks for new samples to draw
+        self.analytics_dirty = threading.Event()  # Set by the sampler thread when there's something new
+        self.log_drain_interval = 100  # ms between log queue drains
         
         # Performance alert settings
         self.memory_threshold_mb = 12288  # 12GB warning threshold
         self.cpu_threshold_percent = 85  # 85% CPU warning threshold
         self.tps_threshold = 15  # TPS warning threshold
-        self.last_memory_alert = None
-        self.last_cpu_alert = None
-        self.last_tps_alert = None
         self.alert_cooldown = 300  # 5 minutes between same-type alerts
-        self.last_alert_time = 0  # Track last alert time for cooldown
+        self.alert_over = {'memory': False, 'cpu': False}  # Metric was above its threshold last sample
+        self.last_alert_time = {'memory': float('-inf'), 'cpu': float('-inf')}  # When each alert type last fired (monotonic)
+        self.alert_sound_pending = threading.Event()  # Set to request a beep from alert_sound_worker
+        threading.Thread(target=self.alert_sound_worker, daemon=True).start()
+        
+        # Short one-shot jobs (server checks) share these workers instead of a new thread per click. The long-lived
+        # loops and process.wait() monitors keep their own daemon threads: they'd hold a worker for good and keep
+        # the interpreter from exiting, since it waits for pool threads
+        self.background = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='msm-bg')
         
         self.setup_ui()
         self.setup_styles()
@@ -109,11 +255,15 @@ class MinecraftServerGUI:
     def on_closing(self):
         """Handle window closing event"""
         self.analytics_running = False  # Stop analytics thread
+        self.closing.set()  # Now, not after the rest of its 5 second wait
+        self.background.shutdown(wait=False)  # A check already running finishes on its own
         self.root.destroy()  # Close the window
         
     def schedule_analytics_update(self):
-        """Schedule periodic analytics display updates"""
-        self.update_analytics_display()
+        """Redraw analytics when the sampler produced new data, however often it samples"""
+        if self.analytics_dirty.is_set():
+            self.analytics_dirty.clear()
+            self.update_analytics_display()
         # Schedule next update
         self.root.after(self.analytics_update_interval, self.schedule_analytics_update)
         
@@ -133,16 +283,6 @@ class MinecraftServerGUI:
                        foreground=text_color, 
                        font=('Arial', 16, 'bold'))
         
-        style.configure('ServerStatus.TLabel',
-                       background=bg_color,
-                       foreground="#ff0000",  # Red for offline
-                       font=('Arial', 12, 'bold'))
-                       
-        style.configure('BotStatus.TLabel',
-                       background=bg_color,
-                       foreground="#ff0000",  # Red for offline  
-                       font=('Arial', 12, 'bold'))
-        
         # Notebook styling
         style.configure('TNotebook', 
                        background=bg_color,
@@ -159,16 +299,18 @@ class MinecraftServerGUI:
         # Frame styling
         style.configure('TFrame', background=bg_color)
         
-        style.configure('ServerStatus.TLabel', 
-                       background='#2b2b2b', 
-                       foreground='#00ff00', 
-                       font=('Arial', 11, 'bold'))
-        
-        style.configure('BotStatus.TLabel', 
-                       background='#2b2b2b', 
-                       foreground='#00ff00', 
-                       font=('Arial', 11, 'bold'))
+        # Player activity table
+        style.configure('Players.Treeview',
+                       background=bg_color,
+                       fieldbackground=bg_color,
+                       foreground=text_color,
+                       font=('Consolas', 10))
+        style.configure('Players.Treeview.Heading',
+                       background="#404040",
+                       foreground=text_color,
+                       font=('Arial', 10, 'bold'))
         
+        # The server/bot status indicators are tk.Labels recolored with config(fg=...) in update_ui_state
         style.configure('Server.TButton',
                        font=('Arial', 10, 'bold'))
         
@@ -234,6 +376,9 @@ class MinecraftServerGUI:
         # Analytics Tab
         self.create_analytics_tab()
         
+        # Tabs that are built or redrawn only once they're shown
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed, add="+")
+        
     def create_bot_tab(self):
         """Create Discord bot management tab"""
         bot_frame = ttk.Frame(self.notebook)
@@ -526,6 +671,20 @@ class MinecraftServerGUI:
         """Create server properties editor tab"""
         props_frame = ttk.Frame(self.notebook)
         self.notebook.add(props_frame, text="⚙️ Server Properties")
+        self.properties_frame = props_frame
+        
+        # Properties file path
+        self.properties_file = os.path.join(self.server_dir, "server.properties")
+        self.properties_cache = None  # (mtime, size, content) of the last read
+        
+        # The editor and its widgets are built the first time the tab is opened (build_properties_tab)
+        self.properties_built = False
+        self.common_props_dialog = None  # Built on first use by show_common_properties
+        
+    def build_properties_tab(self):
+        """Fill in the server properties tab and load the file"""
+        self.properties_built = True
+        props_frame = self.properties_frame
         
         # Title and file path info
         title_frame = tk.Frame(props_frame, bg="#2b2b2b")
@@ -534,9 +693,6 @@ class MinecraftServerGUI:
         tk.Label(title_frame, text="Server Properties Editor", 
                 font=('Arial', 14, 'bold'), bg="#2b2b2b", fg="white").pack(side="left")
                 
-        # Properties file path
-        self.properties_file = os.path.join(self.server_dir, "server.properties")
-        
         # Action buttons
         button_frame = tk.Frame(props_frame, bg="#2b2b2b")
         button_frame.pack(fill="x", padx=10, pady=5)
@@ -599,63 +755,75 @@ class MinecraftServerGUI:
                                         font=('Arial', 10))
         self.properties_status.pack(fill="x", padx=10, pady=5)
         
-        # Load properties file on startup
+        # Load properties file now that the editor exists
         self.reload_properties()
     
     def check_existing_server_process(self):
         """Check if a Minecraft server is already running"""
-        try:
-            import psutil
-            minecraft_processes = []
-            
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    cmdline = proc.info.get('cmdline', [])
-                    if cmdline and 'java' in cmdline[0].lower():
-                        # Check if it's a Minecraft server process
-                        cmdline_str = ' '.join(cmdline).lower()
-                        if (('forgeserver' in cmdline_str) or 
-                            ('minecraft' in cmdline_str) or 
-                            ('neoforge' in cmdline_str) or
-                            ('server.jar' in cmdline_str) or
-                            ('spigot' in cmdline_str) or
-                            ('paper' in cmdline_str) or
-                            ('bukkit' in cmdline_str) or
-                            ('fabric' in cmdline_str) or
-                            ('-server' in cmdline_str and '.jar' in cmdline_str)):
+        if psutil is None:
+            return None  # psutil not available, skip check
+            
+        minecraft_processes = []
+        
+        # Find java processes by name first (a single snapshot on Windows);
+        # the command line is costly to read, so it's only read for those
+        java_pids = snapshot_java_pids()
+        if java_pids is None:
+            java_pids = [proc.info['pid'] for proc in psutil.process_iter(['pid', 'name'])
+                         if 'java' in (proc.info['name'] or '').lower()]
+                         
+        for pid in java_pids:
+            try:
+                proc = psutil.Process(pid)
+                cmdline = proc.cmdline()
+                if cmdline and 'java' in cmdline[0].lower():
+                    # Check if it's a Minecraft server process
+                    cmdline_str = ' '.join(cmdline).lower()
+                    if (('forgeserver' in cmdline_str) or 
+                        ('minecraft' in cmdline_str) or 
+                        ('neoforge' in cmdline_str) or
+                        ('server.jar' in cmdline_str) or
+                        ('spigot' in cmdline_str) or
+                        ('paper' in cmdline_str) or
+                        ('bukkit' in cmdline_str) or
+                        ('fabric' in cmdline_str) or
+                        ('-server' in cmdline_str and '.jar' in cmdline_str)):
+                        
+                        # Get memory usage to find the actual server (not launcher)
+                        try:
+                            memory_mb = proc.memory_info().rss / 1024 / 1024
+                            minecraft_processes.append((pid, memory_mb, ' '.join(cmdline)))
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            continue
                             
-                            # Get memory usage to find the actual server (not launcher)
-                            try:
-                                process = psutil.Process(proc.info['pid'])
-                                memory_mb = process.memory_info().rss / 1024 / 1024
-                                minecraft_processes.append((proc.info['pid'], memory_mb, ' '.join(cmdline)))
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                continue
-                                
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        # Return the process with highest memory usage (actual server, not launcher)
+        if minecraft_processes:
+            # Sort by memory usage (descending) and return the PID of the highest
+            minecraft_processes.sort(key=lambda x: x[1], reverse=True)
+            highest_memory_pid, memory_mb, cmdline = minecraft_processes[0]
             
-            # Return the process with highest memory usage (actual server, not launcher)
-            if minecraft_processes:
-                # Sort by memory usage (descending) and return the PID of the highest
-                minecraft_processes.sort(key=lambda x: x[1], reverse=True)
-                highest_memory_pid, memory_mb, cmdline = minecraft_processes[0]
+            # Only return if memory usage is reasonable for a Minecraft server (>50MB)
+            if memory_mb > 50:  
+                return highest_memory_pid
                 
-                # Only return if memory usage is reasonable for a Minecraft server (>50MB)
-                if memory_mb > 50:  
-                    return highest_memory_pid
-                    
-        except ImportError:
-            # psutil not available, skip check
-            pass
         return None
         
+    def check_existing_server_process_cached(self, ttl=3.0):
+        """check_existing_server_process, reusing a result younger than ttl seconds"""
+        stamp, pid = self.server_scan_cache
+        if time.monotonic() - stamp >= ttl:
+            pid = self.check_existing_server_process()
+            self.server_scan_cache = (time.monotonic(), pid)
+        return pid
+        
     def reload_properties(self):
         """Reload server.properties file"""
         try:
             if os.path.exists(self.properties_file):
-                with open(self.properties_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self.read_properties_file()
                 
                 self.properties_text.delete(1.0, tk.END)
                 self.properties_text.insert(1.0, content)
@@ -668,20 +836,40 @@ class MinecraftServerGUI:
         except Exception as e:
             self.properties_status.config(text=f"Error loading: {e}", fg="#f44336")
             
+    def read_properties_file(self):
+        """server.properties content, only read from disk again once the file changed"""
+        st = os.stat(self.properties_file)
+        cache = self.properties_cache
+        if cache and cache[0] == st.st_mtime_ns and cache[1] == st.st_size:
+            return cache[2]
+        with open(self.properties_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.properties_cache = (st.st_mtime_ns, st.st_size, content)
+        return content
+        
     def save_properties(self):
         """Save current properties to file"""
         try:
             content = self.properties_text.get(1.0, tk.END)
             
-            # Create backup
+            # Write the new content next to the file first, so a failed save never leaves it half written
+            temp_file = self.properties_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(content.rstrip() + '\n')  # Ensure file ends with newline
+                
+            # Create backup: a hard link keeps the old file's data without copying it
             backup_file = self.properties_file + ".backup"
             if os.path.exists(self.properties_file):
-                import shutil
-                shutil.copy2(self.properties_file, backup_file)
-                
-            # Save new content
-            with open(self.properties_file, 'w', encoding='utf-8') as f:
-                f.write(content.rstrip() + '\n')  # Ensure file ends with newline
+                if os.path.exists(backup_file):
+                    os.remove(backup_file)
+                try:
+                    os.link(self.properties_file, backup_file)
+                except OSError:
+                    import shutil  # Filesystem without hard links (FAT/exFAT drives)
+                    shutil.copy2(self.properties_file, backup_file)
+                    
+            # Swap the new content in (atomic rename)
+            os.replace(temp_file, self.properties_file)
                 
             self.properties_status.config(text="Properties saved (backup created)", fg="#4CAF50")
             messagebox.showinfo("Saved", f"Properties saved to:\n{self.properties_file}\n\nBackup created: {backup_file}")
@@ -699,44 +887,30 @@ class MinecraftServerGUI:
             
     def show_common_properties(self):
         """Show a dialog with common server properties"""
-        common_props = {
-            "Basic Settings": [
-                ("server-port", "25565", "Server port (default: 25565)"),
-                ("max-players", "20", "Maximum players"),
-                ("motd", "A Minecraft Server", "Message of the day"),
-                ("difficulty", "easy", "Difficulty: peaceful, easy, normal, hard"),
-                ("gamemode", "survival", "Default gamemode: survival, creative, adventure, spectator")
-            ],
-            "World Settings": [
-                ("level-name", "world", "World folder name"),
-                ("level-seed", "", "World seed (empty for random)"),
-                ("level-type", "minecraft\\:normal", "World type: normal, flat, largeBiomes, amplified"),
-                ("generate-structures", "true", "Generate structures (villages, dungeons, etc.)"),
-                ("spawn-protection", "16", "Spawn protection radius")
-            ],
-            "Performance": [
-                ("view-distance", "10", "Render distance (2-32)"),
-                ("simulation-distance", "10", "Simulation distance (3-32)"),
-                ("max-tick-time", "60000", "Max tick time before server watchdog"),
-                ("entity-broadcast-range-percentage", "100", "Entity broadcast range %")
-            ],
-            "Security": [
-                ("online-mode", "true", "Require valid Minecraft accounts"),
-                ("white-list", "false", "Enable whitelist"),
-                ("enforce-whitelist", "false", "Kick non-whitelisted players"),
-                ("op-permission-level", "4", "OP permission level (1-4)")
-            ]
-        }
+        if self.common_props_dialog is None:
+            self.build_common_properties_dialog()
+        else:
+            self.common_props_dialog.deiconify()
+            self.common_props_dialog.lift()
+        self.common_props_dialog.grab_set()  # Modal while shown
+        
+    def hide_common_properties(self):
+        """Hide the common properties dialog, keeping its widgets for the next open"""
+        self.common_props_dialog.grab_release()
+        self.common_props_dialog.withdraw()
         
+    def build_common_properties_dialog(self):
+        """Create the common properties dialog (once, it's hidden rather than destroyed)"""
         # Create dialog window
         dialog = tk.Toplevel(self.root)
+        self.common_props_dialog = dialog
         dialog.title("Common Server Properties")
         dialog.configure(bg="#2b2b2b")
         dialog.geometry("800x600")
         
         # Make dialog modal
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self.hide_common_properties)
         
         # Main frame with scrollbar
         main_frame = tk.Frame(dialog, bg="#2b2b2b")
@@ -755,7 +929,7 @@ class MinecraftServerGUI:
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Add categories and properties
-        for category, props in common_props.items():
+        for category, props in COMMON_PROPERTIES:
             # Category header
             cat_frame = tk.LabelFrame(scrollable_frame, text=category, 
                                     bg="#3b3b3b", fg="white", font=('Arial', 12, 'bold'))
@@ -775,7 +949,7 @@ class MinecraftServerGUI:
         scrollbar.pack(side="right", fill="y")
         
         # Close button
-        close_btn = tk.Button(dialog, text="Close", command=dialog.destroy,
+        close_btn = tk.Button(dialog, text="Close", command=self.hide_common_properties,
                             bg="#4CAF50", fg="white", font=('Arial', 12, 'bold'),
                             padx=20, pady=10)
         close_btn.pack(pady=10)
@@ -784,6 +958,7 @@ class MinecraftServerGUI:
         """Create analytics and performance dashboard tab"""
         analytics_frame = ttk.Frame(self.notebook)
         self.notebook.add(analytics_frame, text="📊 Analytics")
+        self.analytics_frame = analytics_frame
         
         # Main container
         main_container = tk.Frame(analytics_frame, bg="#2b2b2b")
@@ -798,45 +973,22 @@ class MinecraftServerGUI:
         stats_frame = tk.Frame(perf_frame, bg="#3b3b3b")
         stats_frame.pack(fill="x", padx=10, pady=10)
         
-        # CPU Usage
-        cpu_frame = tk.Frame(stats_frame, bg="#3b3b3b")
-        cpu_frame.pack(side="left", fill="x", expand=True, padx=10)
-        
-        tk.Label(cpu_frame, text="CPU Usage", bg="#3b3b3b", fg="white", 
-                font=('Arial', 11, 'bold')).pack()
-        self.cpu_label = tk.Label(cpu_frame, text="0.0%", bg="#3b3b3b", 
-                                 fg="#4CAF50", font=('Arial', 20, 'bold'))
-        self.cpu_label.pack()
-        
-        # Memory Usage
-        mem_frame = tk.Frame(stats_frame, bg="#3b3b3b")
-        mem_frame.pack(side="left", fill="x", expand=True, padx=10)
-        
-        tk.Label(mem_frame, text="Memory Usage", bg="#3b3b3b", fg="white", 
-                font=('Arial', 11, 'bold')).pack()
-        self.memory_label = tk.Label(mem_frame, text="0 MB", bg="#3b3b3b", 
-                                    fg="#2196F3", font=('Arial', 20, 'bold'))
-        self.memory_label.pack()
-        
-        # Server Uptime
-        uptime_frame = tk.Frame(stats_frame, bg="#3b3b3b")
-        uptime_frame.pack(side="left", fill="x", expand=True, padx=10)
-        
-        tk.Label(uptime_frame, text="Uptime", bg="#3b3b3b", fg="white", 
-                font=('Arial', 11, 'bold')).pack()
-        self.uptime_label = tk.Label(uptime_frame, text="00:00:00", bg="#3b3b3b", 
-                                    fg="#FF9800", font=('Arial', 20, 'bold'))
-        self.uptime_label.pack()
-        
-        # TPS (Ticks Per Second)
-        tps_frame = tk.Frame(stats_frame, bg="#3b3b3b")
-        tps_frame.pack(side="left", fill="x", expand=True, padx=10)
-        
-        tk.Label(tps_frame, text="TPS", bg="#3b3b3b", fg="white", 
-                font=('Arial', 11, 'bold')).pack()
-        self.tps_label = tk.Label(tps_frame, text="20.0", bg="#3b3b3b", 
-                                 fg="#9C27B0", font=('Arial', 20, 'bold'))
-        self.tps_label.pack()
+        # CPU Usage, Memory Usage, Server Uptime and TPS (Ticks Per Second) as equal-width grid columns,
+        # title on the first row and value on the second
+        stats_frame.columnconfigure((0, 1, 2, 3), weight=1, uniform='stats')
+        panels = (("CPU Usage", "0.0%", "#4CAF50"),
+                  ("Memory Usage", "0 MB", "#2196F3"),
+                  ("Uptime", "00:00:00", "#FF9800"),
+                  ("TPS", "20.0", "#9C27B0"))
+        value_labels = []
+        for column, (title, text, color) in enumerate(panels):
+            tk.Label(stats_frame, text=title, bg="#3b3b3b", fg="white", 
+                    font=('Arial', 11, 'bold')).grid(row=0, column=column, padx=10)
+            value_label = tk.Label(stats_frame, text=text, bg="#3b3b3b", 
+                                  fg=color, font=('Arial', 20, 'bold'))
+            value_label.grid(row=1, column=column, padx=10)
+            value_labels.append(value_label)
+        self.cpu_label, self.memory_label, self.uptime_label, self.tps_label = value_labels
         
         # Performance Graph (Simple Text-based for now)
         graph_frame = tk.LabelFrame(main_container, text="📈 Performance History", 
@@ -923,11 +1075,32 @@ class MinecraftServerGUI:
                                    padx=15, pady=5)
         clear_stats_btn.pack(side="left", padx=5)
         
-        # Player activity display
-        self.player_activity_text = scrolledtext.ScrolledText(player_frame, height=10, 
-                                                             bg="#2b2b2b", fg="white", 
-                                                             font=('Consolas', 10))
-        self.player_activity_text.pack(fill="x", padx=10, pady=10)
+        # Player activity display, one row per player updated in place by refresh_player_stats
+        tree_frame = tk.Frame(player_frame, bg="#3b3b3b")
+        tree_frame.pack(fill="x", padx=10, pady=10)
+        
+        self.player_tree = ttk.Treeview(tree_frame, columns=('status', 'total', 'session'),
+                                        height=10, style='Players.Treeview')
+        self.player_tree.heading('#0', text="Player", anchor="w")
+        self.player_tree.heading('status', text="Status", anchor="w")
+        self.player_tree.heading('total', text="Total Playtime", anchor="w")
+        self.player_tree.heading('session', text="Session Time", anchor="w")
+        self.player_tree.column('#0', width=200)
+        self.player_tree.column('status', width=100)
+        self.player_tree.column('total', width=150)
+        self.player_tree.column('session', width=150)
+        
+        player_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.player_tree.yview)
+        self.player_tree.configure(yscrollcommand=player_scrollbar.set)
+        self.player_tree.pack(side="left", fill="x", expand=True)
+        player_scrollbar.pack(side="right", fill="y")
+        
+        # Shown over the empty table until the first player is tracked
+        self.player_empty_label = tk.Label(tree_frame, text="No player data available.\nPlayers will be tracked when they join the server.",
+                                           bg="#2b2b2b", fg="#cccccc", font=('Consolas', 10))
+        self.player_empty_label.place(relx=0.5, rely=0.5, anchor="center")
+        self.player_rows = {}  # Player -> values currently shown in their player_tree row
+        self.player_order = []  # Players in player_tree row order
         
         # Analytics status
         self.analytics_status = tk.Label(main_container, text="Analytics: Starting...", 
@@ -953,75 +1126,51 @@ class MinecraftServerGUI:
                     self.collect_performance_data()
                 else:
                     # Check for external Minecraft server process
-                    external_pid = self.check_existing_server_process()
+                    cached = self.server_psutil
+                    if self.monitoring_external_server and cached is not None and cached.is_running():
+                        external_pid = cached.pid  # Same server as last time, skip the process table scan
+                    else:
+                        # With no server around the answer rarely changes, so rescan every 15s rather than every sample
+                        external_pid = self.check_existing_server_process_cached(ttl=15.0)
                     if external_pid:
                         self.monitoring_external_server = True
                         self.collect_external_performance_data(external_pid)
                     else:
                         self.monitoring_external_server = False
                     
-                # Update display on main thread (with exception handling)
-                try:
-                    if self.analytics_running:  # Check flag before GUI updates
-                        self.root.after(0, self.update_analytics_display)
-                except RuntimeError:
-                    # Main loop is not running anymore, stop analytics
-                    self.analytics_running = False
-                    break
+                # Main thread redraws on its next schedule_analytics_update tick
+                self.analytics_dirty.set()
                 
             except Exception as e:
                 try:
                     if self.analytics_running:
-                        self.root.after(0, lambda: self.analytics_status.config(
-                            text=f"Analytics error: {e}", fg="#f44336"))
+                        self.root.after(0, lambda err=e: self._set_label(
+                            self.analytics_status, f"Analytics error: {err}", "#f44336"))
                 except RuntimeError:
                     # Main loop is not running anymore, stop analytics
                     self.analytics_running = False
                     break
                     
-            time.sleep(5)  # Update every 5 seconds
+            self.closing.wait(5)  # Update every 5 seconds
             
     def collect_performance_data(self):
         """Collect server performance data"""
         try:
-            import psutil
-            
             if hasattr(self.server_process, 'pid'):  # subprocess.Popen object
                 pid = self.server_process.pid
             else:  # psutil.Process object
                 pid = self.server_process.pid
                 
-            process = psutil.Process(pid)
+            process = self.get_server_psutil(pid)
             
-            # Collect CPU and memory data
-            cpu_percent = process.cpu_percent()
-            memory_info = process.memory_info()
-            
-            # Use same memory calculation as external monitoring for consistency
-            try:
-                if hasattr(process, 'memory_full_info'):
-                    full_memory = process.memory_full_info()
-                    if hasattr(full_memory, 'uss'):  # Unique Set Size (Windows)
-                        memory_mb = full_memory.uss / 1024 / 1024
-                    elif hasattr(full_memory, 'wset'):  # Working Set (Windows) 
-                        memory_mb = full_memory.wset / 1024 / 1024
-                    else:
-                        memory_mb = memory_info.rss / 1024 / 1024
-                else:
-                    memory_mb = memory_info.rss / 1024 / 1024
-            except:
-                memory_mb = memory_info.rss / 1024 / 1024
+            # Collect CPU and memory data (same memory calculation as external monitoring)
+            cpu_percent, memory_info, memory_mb = self.sample_server_process(process)
             
             current_time = datetime.now()
             
-            # Store data
-            self.performance_data['cpu'].append(cpu_percent)
-            self.performance_data['memory'].append(memory_mb)
-            self.performance_data['timestamps'].append(current_time)
-            
-            # Try to extract TPS from logs (if available)
-            tps = self.extract_tps_from_logs()
-            self.performance_data['tps'].append(tps if tps else 20.0)
+            # Store data, TPS extracted from logs (if available)
+            tps = self.extract_tps_from_logs(cpu_percent)
+            self.record_performance(cpu_percent, memory_mb, tps if tps else 20.0, current_time)
             
             # Set server start time
             if not self.server_start_time:
@@ -1029,70 +1178,119 @@ class MinecraftServerGUI:
                 
         except Exception as e:
             # If we can't get process info, add placeholder data
-            self.performance_data['cpu'].append(0)
-            self.performance_data['memory'].append(0)
-            self.performance_data['timestamps'].append(datetime.now())
-            self.performance_data['tps'].append(20.0)
+            self.record_performance(0, 0, 20.0)
+            
+    def record_performance(self, cpu, memory, tps, timestamp=None):
+        """Append one sample to every performance column"""
+        data = self.performance_data
+        data['cpu'].append(cpu)
+        data['memory'].append(memory)
+        data['timestamps'].append(timestamp or datetime.now())
+        data['tps'].append(tps)
+        self.performance_samples += 1
+        
+        # Fold the sample into the current minute, closing it into performance_minutes when it's over
+        now = data['timestamps'][-1]
+        bucket = self.minute_bucket
+        if bucket and (now - bucket[0]).total_seconds() >= 60:
+            count = bucket[4]
+            self.performance_minutes.append((bucket[0], bucket[1] / count, bucket[2] / count, bucket[3] / count))
+            bucket = None
+        if bucket is None:
+            self.minute_bucket = [now, cpu, memory, tps, 1]
+        else:
+            bucket[1] += cpu
+            bucket[2] += memory
+            bucket[3] += tps
+            bucket[4] += 1
+        
+    def clear_performance_data(self):
+        """Forget the performance history (new server session)"""
+        for column in self.performance_data.values():
+            column.clear()
+        self.performance_minutes.clear()
+        self.minute_bucket = None
+        self.performance_samples = 0
+        self.performance_drawn = None  # Start the history table over too
+        self.reported_tps = None  # A TPS reading belongs to the session that printed it
+        
+    def performance_averages(self, minutes=60):
+        """Average (cpu, memory, tps) over the last minutes of per-minute history, None without any"""
+        recent = list(newest(self.performance_minutes, minutes))
+        if not recent:
+            return None
+        count = len(recent)
+        return (sum(m[1] for m in recent) / count, sum(m[2] for m in recent) / count,
+                sum(m[3] for m in recent) / count, count)
+            
+    def get_server_psutil(self, pid):
+        """Cached psutil handle for the server, so cpu_percent() measures the time since the last sample"""
+        process = self.server_psutil
+        if process is None or process.pid != pid or not process.is_running():
+            process = psutil.Process(pid)
+            process.cpu_percent(None)  # The first call on a handle only starts the measurement
+            self.server_psutil = process
+        return process
+        
+    def sample_server_process(self, process):
+        """(cpu percent, memory_info, memory MB) of the server process from one batched read of its stats"""
+        with process.oneshot():  # The calls below share one query of the process instead of one each
+            cpu_percent = process.cpu_percent()
+            memory_info = process.memory_info()
+            memory_mb = memory_info.rss / 1024 / 1024
             
-    def extract_tps_from_logs(self):
+            # On Windows, try to get Private Working Set (closer to Task Manager)
+            try:
+                full_memory = process.memory_full_info()
+                if hasattr(full_memory, 'uss'):  # Unique Set Size (Windows)
+                    memory_mb = full_memory.uss / 1024 / 1024
+                elif hasattr(full_memory, 'wset'):  # Working Set (Windows)
+                    memory_mb = full_memory.wset / 1024 / 1024
+            except Exception:
+                pass  # Fallback to RSS if Windows-specific methods fail
+        return cpu_percent, memory_info, memory_mb
+        
+    def extract_tps_from_logs(self, current_cpu):
         """Extract TPS information from server logs"""
-        # This is a simplified TPS extraction - real TPS would need server-side monitoring
-        # For now, we'll simulate based on performance
+        # Real TPS when a tps command reported it in the last 5 minutes
+        reported = self.reported_tps
+        if reported and time.monotonic() - reported[1] < 300:
+            return reported[0]
+        # Otherwise simulate based on performance: the new CPU sample plus the 4 before it
         try:
-            if self.performance_data['cpu']:
-                cpu_avg = sum(list(self.performance_data['cpu'])[-5:]) / min(5, len(self.performance_data['cpu']))
-                # Simulate TPS based on CPU usage (higher CPU = lower TPS)
-                if cpu_avg > 80:
-                    return max(5.0, 20.0 - (cpu_avg - 80) * 0.5)
-                else:
-                    return 20.0
+            recent = [current_cpu, *itertools.islice(reversed(self.performance_data['cpu']), 4)]
+            cpu_avg = sum(recent) / len(recent)
+            # Simulate TPS based on CPU usage (higher CPU = lower TPS)
+            if cpu_avg > 80:
+                return max(5.0, 20.0 - (cpu_avg - 80) * 0.5)
+            else:
+                return 20.0
         except:
             pass
         return 20.0
         
     def collect_external_performance_data(self, pid):
         """Collect performance data from external Minecraft server process"""
+        if psutil is None:
+            self.record_performance(0, 0, 20.0)
+            return
         try:
-            import psutil
-            process = psutil.Process(pid)
+            process = self.get_server_psutil(pid)
             
             # Get process info for debugging
             process_name = process.name()
             
             # Collect CPU and memory data
-            cpu_percent = process.cpu_percent()
-            memory_info = process.memory_info()
-            
-            # On Windows, try to get Private Working Set (closer to Task Manager)
-            try:
-                # Try to get Windows-specific memory info
-                if hasattr(process, 'memory_full_info'):
-                    full_memory = process.memory_full_info()
-                    if hasattr(full_memory, 'uss'):  # Unique Set Size (Windows)
-                        memory_mb = full_memory.uss / 1024 / 1024
-                    elif hasattr(full_memory, 'wset'):  # Working Set (Windows) 
-                        memory_mb = full_memory.wset / 1024 / 1024
-                    else:
-                        memory_mb = memory_info.rss / 1024 / 1024
-                else:
-                    memory_mb = memory_info.rss / 1024 / 1024
-            except:
-                # Fallback to RSS if Windows-specific methods fail
-                memory_mb = memory_info.rss / 1024 / 1024
+            cpu_percent, memory_info, memory_mb = self.sample_server_process(process)
             
             # Also get virtual memory for comparison
             vms_mb = memory_info.vms / 1024 / 1024  # Virtual memory
             
             current_time = datetime.now()
             
-            # Store data
-            self.performance_data['cpu'].append(cpu_percent)
-            self.performance_data['memory'].append(memory_mb)
-            self.performance_data['timestamps'].append(current_time)
-            
-            # Try to extract TPS from logs (if available)
-            tps = self.extract_tps_from_logs()
-            self.performance_data['tps'].append(tps if tps else 20.0)
+            # Store data, TPS extracted from logs (if available)
+            tps = self.extract_tps_from_logs(cpu_percent)
+            self.record_performance(cpu_percent, memory_mb, tps if tps else 20.0, current_time)
             
             # Store additional debug info 
             if not hasattr(self, 'last_process_debug'):
@@ -1133,18 +1331,32 @@ class MinecraftServerGUI:
                 except:
                     self.server_start_time = current_time
                     
-        except (psutil.NoSuchProcess, psutil.AccessDenied, ImportError) as e:
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
             # If we can't get process info, add placeholder data
-            self.performance_data['cpu'].append(0)
-            self.performance_data['memory'].append(0)
-            self.performance_data['timestamps'].append(datetime.now())
-            self.performance_data['tps'].append(20.0)
+            self.record_performance(0, 0, 20.0)
+        
+    def on_tab_changed(self, event=None):
+        """Build the properties editor on first view, bring the analytics display up to date"""
+        if not self.properties_built and self.notebook.select() == str(self.properties_frame):
+            self.build_properties_tab()
+        elif self.analytics_tab_visible():
+            self.update_analytics_display()
+            
+    def analytics_tab_visible(self):
+        """True while the Analytics tab is the selected one"""
+        return self.notebook.select() == str(self.analytics_frame)
         
     def update_analytics_display(self):
         """Update the analytics display with current data"""
         try:
-            # Check if we have performance data (from internal server or if we have collected external data)
-            has_server_data = self.performance_data['cpu'] and len(self.performance_data['cpu']) > 0
+            # Check if we have performance data (from internal server or if we have collected external data);
+            # whether there's a server at all comes from the flags the sampler keeps, never a process scan here
+            if self.server_running or self.monitoring_external_server:
+                has_server_data = bool(self.performance_data['cpu'])
+            else:
+                has_server_data = False
+            # Samples keep being collected; only drawing them waits until the tab is visible
+            visible = self.analytics_tab_visible()
                              
             if has_server_data:
                 # Update current stats
@@ -1152,62 +1364,83 @@ class MinecraftServerGUI:
                 current_memory = self.performance_data['memory'][-1] if self.performance_data['memory'] else 0
                 current_tps = self.performance_data['tps'][-1] if self.performance_data['tps'] else 20.0
                 
-                self.cpu_label.config(text=f"{current_cpu:.1f}%")
-                self.memory_label.config(text=f"{current_memory:.0f} MB")
-                self.tps_label.config(text=f"{current_tps:.1f}")
-                
                 # Check for performance alerts
                 self.check_performance_alerts(current_memory, current_cpu)
                 
-                # Update uptime
-                if self.server_start_time:
-                    uptime = datetime.now() - self.server_start_time
-                    hours = int(uptime.total_seconds() // 3600)
-                    minutes = int((uptime.total_seconds() % 3600) // 60)
-                    seconds = int(uptime.total_seconds() % 60)
-                    self.uptime_label.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-                
-                # Color code based on performance
-                if current_cpu > 80:
-                    self.cpu_label.config(fg="#f44336")  # Red for high CPU
-                elif current_cpu > 50:
-                    self.cpu_label.config(fg="#FF9800")  # Orange for medium CPU
-                else:
-                    self.cpu_label.config(fg="#4CAF50")  # Green for low CPU
-                    
-                if current_tps < 15:
-                    self.tps_label.config(fg="#f44336")  # Red for low TPS
-                elif current_tps < 18:
-                    self.tps_label.config(fg="#FF9800")  # Orange for medium TPS
-                else:
-                    self.tps_label.config(fg="#4CAF50")  # Green for good TPS
-                
-                # Update performance history
-                self.update_performance_graph()
-                
-                # Update status based on server type
-                if self.server_running:
-                    self.analytics_status.config(text="Analytics: Active (Internal Server)", fg="#4CAF50")
-                elif self.monitoring_external_server:
-                    self.analytics_status.config(text="Analytics: Active (External Server)", fg="#2196F3")
-                else:
-                    self.analytics_status.config(text="Analytics: Active", fg="#4CAF50")
+                if visible:
+                    self.draw_analytics(current_cpu, current_memory, current_tps)
                     
                 # Update console status
                 self.update_console_status()
             else:
                 # Server offline
-                self.cpu_label.config(text="0.0%", fg="#666666")
-                self.memory_label.config(text="0 MB", fg="#666666")
-                self.uptime_label.config(text="00:00:00", fg="#666666")
-                self.tps_label.config(text="--", fg="#666666")
-                self.analytics_status.config(text="Analytics: No Server Detected", fg="#FF9800")
+                if visible:
+                    self._set_label(self.cpu_label, "0.0%", "#666666")
+                    self._set_label(self.memory_label, "0 MB", "#666666")
+                    self._set_label(self.uptime_label, "00:00:00", "#666666")
+                    self.uptime_shown = None
+                    self._set_label(self.tps_label, "--", "#666666")
+                    self._set_label(self.analytics_status, "Analytics: No Server Detected", "#FF9800")
                 
                 # Update console status
                 self.update_console_status()
                 
         except Exception as e:
-            self.analytics_status.config(text=f"Analytics error: {e}", fg="#f44336")
+            self._set_label(self.analytics_status, f"Analytics error: {e}", "#f44336")
+            
+    def draw_analytics(self, current_cpu, current_memory, current_tps):
+        """Show the latest sample on the Analytics tab"""
+        # Color code based on performance
+        if current_cpu > 80:
+            cpu_color = "#f44336"  # Red for high CPU
+        elif current_cpu > 50:
+            cpu_color = "#FF9800"  # Orange for medium CPU
+        else:
+            cpu_color = "#4CAF50"  # Green for low CPU
+            
+        if current_tps < 15:
+            tps_color = "#f44336"  # Red for low TPS
+        elif current_tps < 18:
+            tps_color = "#FF9800"  # Orange for medium TPS
+        else:
+            tps_color = "#4CAF50"  # Green for good TPS
+            
+        self._set_label(self.cpu_label, f"{current_cpu:.1f}%", cpu_color)
+        self._set_label(self.memory_label, f"{current_memory:.0f} MB", "#2196F3")
+        self._set_label(self.tps_label, f"{current_tps:.1f}", tps_color)
+        
+        # Update uptime
+        if self.server_start_time:
+            uptime = int((datetime.now() - self.server_start_time).total_seconds())
+            if uptime != self.uptime_shown:  # Same whole second as the last redraw, nothing to format
+                self.uptime_shown = uptime
+                minutes, seconds = divmod(uptime, 60)
+                hours, minutes = divmod(minutes, 60)
+                self._set_label(self.uptime_label, f"{hours:02d}:{minutes:02d}:{seconds:02d}", "#FF9800")
+        
+        # Update performance history
+        self.update_performance_graph()
+        
+        # Update status based on server type
+        if self.server_running:
+            self._set_label(self.analytics_status, "Analytics: Active (Internal Server)", "#4CAF50")
+        elif self.monitoring_external_server:
+            self._set_label(self.analytics_status, "Analytics: Active (External Server)", "#2196F3")
+        else:
+            self._set_label(self.analytics_status, "Analytics: Active", "#4CAF50")
+            
+    def _set_label(self, label, text, fg):
+        """Set a label's text and color in one configure call, skipped when neither changed"""
+        key = str(label)
+        if self.label_cache.get(key) == (text, fg):
+            return
+        if key in self.flashing:
+            # Keep the alert flash showing; flash_label applies fg when it ends
+            self.flashing[key] = fg
+            label.configure(text=text)
+        else:
+            label.configure(text=text, fg=fg)
+        self.label_cache[key] = (text, fg)
             
     def update_console_status(self):
         """Update console status and enable/disable command input"""
@@ -1236,169 +1469,180 @@ class MinecraftServerGUI:
     def update_performance_graph(self):
         """Update the performance graph display"""
         try:
-            if not self.performance_data['timestamps']:
+            # Both the 5s timer and the sampler ask for redraws; only a new sample changes the table.
+            # New samples are counted rather than picked by timestamp, which the wall clock can move backwards
+            data = self.performance_data
+            samples = self.performance_samples
+            drawn = self.performance_drawn
+            new_count = min(10, samples if drawn is None else samples - drawn)
+            fresh = list(zip(newest(data['timestamps'], new_count), newest(data['cpu'], new_count),
+                             newest(data['memory'], new_count), newest(data['tps'], new_count)))
+            if not fresh:
                 return
                 
-            self.performance_text.config(state='normal')
-            self.performance_text.delete(1.0, tk.END)
-            
-            # Show last 10 data points
-            recent_data = list(zip(
-                list(self.performance_data['timestamps'])[-10:],
-                list(self.performance_data['cpu'])[-10:],
-                list(self.performance_data['memory'])[-10:],
-                list(self.performance_data['tps'])[-10:]
-            ))
-            
-            header = f"{'Time':<8} {'CPU%':<6} {'Memory(MB)':<12} {'TPS':<6}\n"
             separator = "-" * 40 + "\n"
-            
-            self.performance_text.insert(tk.END, header)
-            self.performance_text.insert(tk.END, separator)
-            
-            for timestamp, cpu, memory, tps in recent_data:
-                time_str = timestamp.strftime("%H:%M:%S")
-                line = f"{time_str:<8} {cpu:<6.1f} {memory:<12.0f} {tps:<6.1f}\n"
-                self.performance_text.insert(tk.END, line)
-                
-            self.performance_text.config(state='disabled')
-            self.performance_text.see(tk.END)
+            text = self.performance_text
+            text.config(state='normal')
+            if drawn is None:
+                # Fresh table: header and separator on lines 1-2, sample rows from line 3
+                text.delete(1.0, tk.END)
+                text.insert(tk.END, f"{'Time':<8} {'CPU%':<6} {'Memory(MB)':<12} {'TPS':<6}\n" + separator)
+                self.performance_rows = 0
+            else:
+                text.delete(f"{3 + self.performance_rows}.0", tk.END)  # Drop the average footer
+                
+            # Append the new rows and drop the oldest past 10, instead of rewriting the table
+            text.insert(tk.END, "".join(f"{timestamp.strftime('%H:%M:%S'):<8} {cpu:<6.1f} {memory:<12.0f} {tps:<6.1f}\n"
+                                        for timestamp, cpu, memory, tps in fresh))
+            self.performance_rows += len(fresh)
+            if self.performance_rows > 10:
+                text.delete("3.0", f"{3 + self.performance_rows - 10}.0")
+                self.performance_rows = 10
+                
+            averages = self.performance_averages(60)
+            if averages:
+                cpu, memory, tps, count = averages
+                text.insert(tk.END, separator + f"{'Avg ' + str(count) + 'm':<8} {cpu:<6.1f} {memory:<12.0f} {tps:<6.1f}\n")
+            text.config(state='disabled')
+            text.see(tk.END)
+            self.performance_drawn = samples
             
         except Exception:
             pass  # Ignore graph update errors
             
     def refresh_player_stats(self):
         """Refresh player statistics display"""
-        self.player_activity_text.delete(1.0, tk.END)
+        tree = self.player_tree
         
+        # Rows of players that are no longer tracked (Clear Stats)
+        for player in self.player_rows.keys() - self.player_data.keys():
+            tree.delete(player)
+            del self.player_rows[player]
+            
         if not self.player_data:
-            self.player_activity_text.insert(tk.END, "No player data available.\nPlayers will be tracked when they join the server.\n")
+            self.player_empty_label.place(relx=0.5, rely=0.5, anchor="center")
+            self.player_order = []
             return
-            
+        self.player_empty_label.place_forget()
+        
         # Sort players by total playtime
         sorted_players = sorted(self.player_data.items(), 
                               key=lambda x: x[1].get('total_playtime', 0), reverse=True)
         
-        header = f"{'Player':<20} {'Status':<10} {'Total Playtime':<15} {'Session Time'}\n"
-        separator = "-" * 70 + "\n"
-        
-        self.player_activity_text.insert(tk.END, header)
-        self.player_activity_text.insert(tk.END, separator)
-        
+        now = time.monotonic()
         for player, data in sorted_players:
             total_seconds = data.get('total_playtime', 0)
             hours = int(total_seconds // 3600)
             minutes = int((total_seconds % 3600) // 60)
             
-            status = "Online" if data.get('join_time') else "Offline"
+            online = 'join_time' in data
+            status = "Online" if online else "Offline"
             total_time_str = f"{hours}h {minutes}m"
             
             session_time = ""
-            if data.get('join_time'):
-                session_seconds = (datetime.now() - data['join_time']).total_seconds()
+            if online:
+                session_seconds = now - data['join_time']
                 session_hours = int(session_seconds // 3600)
                 session_minutes = int((session_seconds % 3600) // 60)
                 session_time = f"{session_hours}h {session_minutes}m"
             
-            line = f"{player:<20} {status:<10} {total_time_str:<15} {session_time}\n"
-            self.player_activity_text.insert(tk.END, line)
+            # Only touch rows whose text changed
+            values = (status, total_time_str, session_time)
+            shown = self.player_rows.get(player)
+            if shown is None:
+                tree.insert('', tk.END, iid=player, text=player, values=values)
+            elif shown != values:
+                tree.item(player, values=values)
+            self.player_rows[player] = values
+            
+        # Reorder rows only when the ranking changed
+        order = [player for player, data in sorted_players]
+        if order != self.player_order:
+            for index, player in enumerate(order):
+                tree.move(player, '', index)
+            self.player_order = order
             
     def clear_player_stats(self):
         """Clear all player statistics"""
         if messagebox.askyesno("Clear Stats", "This will clear all player activity data.\n\nAre you sure?"):
             self.player_data.clear()
             self.refresh_player_stats()
-            self.analytics_status.config(text="Player stats cleared", fg="#FF9800")
+            self._set_label(self.analytics_status, "Player stats cleared", "#FF9800")
             
     def track_player_join(self, player_name):
         """Track when a player joins"""
         if player_name not in self.player_data:
             self.player_data[player_name] = {'total_playtime': 0}
         
-        self.player_data[player_name]['join_time'] = datetime.now()
+        self.player_data[player_name]['join_time'] = time.monotonic()
         
     def track_player_leave(self, player_name):
         """Track when a player leaves"""
         if player_name in self.player_data and 'join_time' in self.player_data[player_name]:
             join_time = self.player_data[player_name]['join_time']
-            session_time = (datetime.now() - join_time).total_seconds()
+            session_time = time.monotonic() - join_time
             
             self.player_data[player_name]['total_playtime'] += session_time
             del self.player_data[player_name]['join_time']  # Remove join_time to mark as offline
     
-    def detect_existing_bot(self):
-        """Detect existing Discord bot process with improved search"""
-        try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                try:
-                    cmdline = proc.info.get('cmdline', [])
-                    cwd = proc.info.get('cwd', '')
-                    
-                    if not cmdline:
-                        continue
-                        
-                    # Check if it's a Python process
-                    if 'python' not in cmdline[0].lower():
-                        continue
+    def _scan_bot_candidates(self, ttl=2.0):
+        """Python processes that look like the Discord bot as (pid, name, cmdline, cwd_lower), cached for ttl seconds"""
+        stamp, candidates = self.bot_scan_cache
+        if time.monotonic() - stamp < ttl:
+            return candidates
+        if psutil is None:
+            return []
+            
+        candidates = []
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            try:
+                cmdline = proc.info.get('cmdline') or []
+                
+                # Check if it's a Python process
+                if not cmdline or 'python' not in cmdline[0].lower():
+                    continue
                     
-                    # Check multiple patterns for bot.py
-                    cmdline_str = ' '.join(cmdline).lower()
-                    if any(pattern in cmdline_str for pattern in ['bot.py', 'discord', 'bot']):
-                        # Additional check: see if it's running from our bot directory
-                        if self.bot_dir.lower() in cwd.lower():
-                            return proc.info['pid']
-                        # Or if bot.py is explicitly in the command line
-                        if 'bot.py' in cmdline_str:
-                            return proc.info['pid']
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # Check multiple patterns for bot.py
+                cmdline_str = ' '.join(cmdline)
+                if not BOT_CMDLINE_RE.search(cmdline_str):
                     continue
-        except ImportError:
-            pass
+                    
+                # The working directory only matters when bot.py isn't named outright, so skip the lookup otherwise
+                cwd = '' if BOT_SCRIPT_RE.search(cmdline_str) else process_cwd(proc).lower()
+                candidates.append((proc.info['pid'], proc.name(), cmdline_str, cwd))  # Name only for the few that matched
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+                
+        self.bot_scan_cache = (time.monotonic(), candidates)
+        return candidates
+    
+    def detect_existing_bot(self):
+        """Detect existing Discord bot process with improved search"""
+        for pid, name, cmdline, cwd in self._scan_bot_candidates():
+            # Either bot.py is explicitly in the command line or it's running from our bot directory
+            if BOT_SCRIPT_RE.search(cmdline) or self.bot_dir.lower() in cwd:
+                return pid
         return None
     
     def kill_all_bot_processes(self):
         """Force kill all Discord bot processes"""
         killed_count = 0
-        try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                try:
-                    cmdline = proc.info.get('cmdline', [])
-                    cwd = proc.info.get('cwd', '')
-                    
-                    if not cmdline:
-                        continue
-                        
-                    # Check if it's a Python process
-                    if 'python' not in cmdline[0].lower():
-                        continue
-                    
-                    # Check multiple patterns for bot.py
-                    cmdline_str = ' '.join(cmdline).lower()
-                    if any(pattern in cmdline_str for pattern in ['bot.py']):
-                        # Additional check: see if it's running from our bot directory or has bot.py
-                        if (self.bot_dir.lower() in cwd.lower()) or ('bot.py' in cmdline_str):
-                            try:
-                                process = psutil.Process(proc.info['pid'])
-                                process.kill()
-                                killed_count += 1
-                                self.bot_log_display.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] Killed bot process PID: {proc.info['pid']}\n")
-                                self.bot_log_display.see(tk.END)
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-                                
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except ImportError:
-            pass
+        for pid, name, cmdline, cwd in self._scan_bot_candidates():
+            if not BOT_SCRIPT_RE.search(cmdline):
+                continue
+            try:
+                psutil.Process(pid).kill()
+                killed_count += 1
+                self.bot_log_display.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] Killed bot process PID: {pid}\n")
+                self.bot_log_display.see(tk.END)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        self.bot_scan_cache = (float('-inf'), [])  # The sweep no longer reflects what's running
         return killed_count
     
     def monitor_existing_bot(self, process):
         """Monitor an existing bot process we connected to"""
         try:
-            import psutil
             # Wait for the process to end
             process.wait()
             # When it ends, update our state
@@ -1411,29 +1655,12 @@ class MinecraftServerGUI:
     
     def find_running_bot(self):
         """Manually search for and connect to a running bot process"""
+        if psutil is None:
+            messagebox.showerror("Error", "psutil library not available for process detection.")
+            return
         try:
-            import psutil
-            found_processes = []
-            
             # Search for potential bot processes
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                try:
-                    cmdline = proc.info.get('cmdline', [])
-                    name = proc.info.get('name', '')
-                    cwd = proc.info.get('cwd', '')
-                    
-                    if not cmdline:
-                        continue
-                        
-                    # Check if it's a Python process
-                    if 'python' in cmdline[0].lower():
-                        cmdline_str = ' '.join(cmdline).lower()
-                        # Look for potential bot indicators
-                        if any(indicator in cmdline_str for indicator in ['bot.py', 'discord', 'bot']):
-                            found_processes.append((proc.info['pid'], name, ' '.join(cmdline)[:80] + '...'))
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            found_processes = [(pid, name, cmdline[:80] + '...') for pid, name, cmdline, cwd in self._scan_bot_candidates()]
             
             if not found_processes:
                 messagebox.showinfo("No Bot Found", "No potential Discord bot processes found.")
@@ -1454,6 +1681,7 @@ class MinecraftServerGUI:
                     self.add_bot_gui_message(f"Killed existing bot process PID {pid} ({name})")
                 except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                     self.add_bot_gui_message(f"Could not kill PID {pid}: {e}")
+            self.bot_scan_cache = (float('-inf'), [])  # The sweep no longer reflects what's running
             
             if killed_count > 0:
                 details_text = "\n".join(killed_details)
@@ -1466,8 +1694,6 @@ class MinecraftServerGUI:
             self.bot_process = None
             self.update_ui_state()
                 
-        except ImportError:
-            messagebox.showerror("Error", "psutil library not available for process detection.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to search for bot processes: {e}")
     
@@ -1569,9 +1795,9 @@ class MinecraftServerGUI:
     def kill_specific_process(self, pid, name, window):
         """Kill a specific process and refresh the dialog"""
         try:
-            import psutil
             process = psutil.Process(pid)
             process.kill()
+            self.bot_scan_cache = (float('-inf'), [])  # The sweep no longer reflects what's running
             self.add_bot_gui_message(f"Killed process PID {pid} ({name})")
             
             # Refresh the dialog by closing it and re-running find
@@ -1590,7 +1816,6 @@ class MinecraftServerGUI:
     def connect_to_bot_process(self, pid):
         """Connect to a specific bot process by PID"""
         try:
-            import psutil
             bot_process = psutil.Process(pid)
             self.bot_process = bot_process
             self.bot_running = True
@@ -1648,10 +1873,8 @@ class MinecraftServerGUI:
                 self.server_running = True
                 # Reset analytics data for new server session
                 self.server_start_time = datetime.now()
-                self.performance_data['cpu'].clear()
-                self.performance_data['memory'].clear()
-                self.performance_data['timestamps'].clear()
-                self.performance_data['tps'].clear()
+                self.clear_performance_data()
+                self.server_psutil = None
                 self.update_ui_state()
                 
                 # Start reading server output
@@ -1776,49 +1999,48 @@ class MinecraftServerGUI:
             self.console_output.see(tk.END)
             
         # Run the check in a separate thread to avoid blocking the GUI
-        threading.Thread(target=self._perform_server_check, daemon=True).start()
+        self.background.submit(self._perform_server_check)
         
     def _perform_server_check(self):
         """Perform server status check in background thread"""
         results = []
         
         # Check 1: Process detection
-        try:
-            import psutil
-            java_processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                try:
-                    cmdline = proc.info.get('cmdline', [])
-                    name = proc.info.get('name', '')
-                    cwd = proc.info.get('cwd', '')
-                    
-                    if not cmdline:
-                        continue
+        if psutil is None:
+            results.append("⚠️ psutil not available for process detection")
+        else:
+            try:
+                java_processes = []
+                for proc in psutil.process_iter(['pid', 'name']):
+                    try:
+                        name = proc.info.get('name') or ''
                         
-                    # Check if it's a Java process
-                    if 'java' in name.lower():
-                        cmdline_str = ' '.join(cmdline).lower()
-                        # Look for server indicators
-                        if any(indicator in cmdline_str for indicator in ['server', 'minecraft', 'forge', 'neoforge', 'fabric']):
-                            java_processes.append((proc.info['pid'], name, cwd))
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            if java_processes:
-                for pid, name, cwd in java_processes:
-                    results.append(f"✅ Found Java server process: PID {pid} ({name})")
-                    if cwd and self.server_dir.lower() in cwd.lower():
-                        results.append(f"   └── Running from correct directory: {cwd}")
-                    elif cwd:
-                        results.append(f"   └── Running from: {cwd}")
-            else:
-                results.append("❌ No Java server processes found")
+                        # Check if it's a Java process; only those get their command line and directory read
+                        if 'java' in name.lower():
+                            cmdline = proc.cmdline()
+                            if not cmdline:
+                                continue
+                            cmdline_str = ' '.join(cmdline).lower()
+                            # Look for server indicators
+                            if any(indicator in cmdline_str for indicator in ['server', 'minecraft', 'forge', 'neoforge', 'fabric']):
+                                cwd = process_cwd(proc)
+                                java_processes.append((proc.info['pid'], name, cwd))
+                                
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
                 
-        except ImportError:
-            results.append("⚠️ psutil not available for process detection")
-        except Exception as e:
-            results.append(f"❌ Error checking processes: {e}")
+                if java_processes:
+                    for pid, name, cwd in java_processes:
+                        results.append(f"✅ Found Java server process: PID {pid} ({name})")
+                        if cwd and self.server_dir.lower() in cwd.lower():
+                            results.append(f"   └── Running from correct directory: {cwd}")
+                        elif cwd:
+                            results.append(f"   └── Running from: {cwd}")
+                else:
+                    results.append("❌ No Java server processes found")
+                    
+            except Exception as e:
+                results.append(f"❌ Error checking processes: {e}")
             
         # Check 2: Port availability (25565)
         try:
@@ -1849,24 +2071,27 @@ class MinecraftServerGUI:
             results.append(f"❌ Server query failed: {e}")
             
         # Check 4: Log file activity
-        if os.path.exists(self.log_file):
-            try:
-                stat = os.stat(self.log_file)
-                mod_time = datetime.fromtimestamp(stat.st_mtime)
-                time_diff = datetime.now() - mod_time
-                
-                if time_diff.seconds < 300:  # Less than 5 minutes
-                    results.append(f"✅ Log file recently active (last update: {mod_time.strftime('%H:%M:%S')})")
-                else:
-                    results.append(f"⚠️ Log file not recently updated (last update: {mod_time.strftime('%H:%M:%S')})")
-            except Exception as e:
-                results.append(f"❌ Error checking log file: {e}")
-        else:
-            results.append(f"❌ Log file not found: {self.log_file}")
+        results.append(self.check_log_activity())
             
         # Display results in main thread
         self.root.after(0, lambda: self._display_server_check_results(results))
         
+    def check_log_activity(self):
+        """One-line report on how recently the server log was written"""
+        try:
+            stat = os.stat(self.log_file)  # Also tells whether it exists, no separate exists() probe
+        except FileNotFoundError:
+            return f"❌ Log file not found: {self.log_file}"
+        except Exception as e:
+            return f"❌ Error checking log file: {e}"
+            
+        mod_time = datetime.fromtimestamp(stat.st_mtime)
+        time_diff = datetime.now() - mod_time
+        
+        if time_diff.total_seconds() < 300:  # Less than 5 minutes
+            return f"✅ Log file recently active (last update: {mod_time.strftime('%H:%M:%S')})"
+        return f"⚠️ Log file not recently updated (last update: {mod_time.strftime('%H:%M:%S')})"
+        
     def _display_server_check_results(self, results):
         """Display server check results in the console"""
         self.console_output.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] 📊 Server Status Check Results:\n")
@@ -1899,7 +2124,7 @@ class MinecraftServerGUI:
             self.console_output.see(tk.END)
             
         # Run the check in a separate thread
-        threading.Thread(target=self._perform_smart_server_check, daemon=True).start()
+        self.background.submit(self._perform_smart_server_check)
         
     def _perform_smart_server_check(self):
         """Perform smart server check in background thread"""
@@ -1908,41 +2133,40 @@ class MinecraftServerGUI:
         server_responsive = False
         
         # Check 1: Process detection with connection capability
-        try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
-                try:
-                    cmdline = proc.info.get('cmdline', [])
-                    name = proc.info.get('name', '')
-                    cwd = proc.info.get('cwd', '')
-                    
-                    if not cmdline:
-                        continue
+        if psutil is None:
+            results.append("⚠️ psutil not available for process detection")
+        else:
+            try:
+                for proc in psutil.process_iter(['pid', 'name']):
+                    try:
+                        name = proc.info.get('name') or ''
                         
-                    # Check if it's a Java process
-                    if 'java' in name.lower():
-                        cmdline_str = ' '.join(cmdline).lower()
-                        # Look for server indicators
-                        if any(indicator in cmdline_str for indicator in ['server', 'minecraft', 'forge', 'neoforge', 'fabric']):
-                            is_our_server = cwd and self.server_dir.lower() in cwd.lower()
-                            found_server_processes.append((proc.info['pid'], name, cwd, is_our_server))
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            if found_server_processes:
-                for pid, name, cwd, is_our_server in found_server_processes:
-                    marker = " (OUR DIRECTORY)" if is_our_server else ""
-                    results.append(f"✅ Found Java server process: PID {pid} ({name}){marker}")
-                    if cwd:
-                        results.append(f"   └── Running from: {cwd}")
-            else:
-                results.append("❌ No Java server processes found")
+                        # Check if it's a Java process; only those get their command line and directory read
+                        if 'java' in name.lower():
+                            cmdline = proc.cmdline()
+                            if not cmdline:
+                                continue
+                            cmdline_str = ' '.join(cmdline).lower()
+                            # Look for server indicators
+                            if any(indicator in cmdline_str for indicator in ['server', 'minecraft', 'forge', 'neoforge', 'fabric']):
+                                cwd = process_cwd(proc)
+                                is_our_server = cwd and self.server_dir.lower() in cwd.lower()
+                                found_server_processes.append((proc.info['pid'], name, cwd, is_our_server))
+                                
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
                 
-        except ImportError:
-            results.append("⚠️ psutil not available for process detection")
-        except Exception as e:
-            results.append(f"❌ Error checking processes: {e}")
+                if found_server_processes:
+                    for pid, name, cwd, is_our_server in found_server_processes:
+                        marker = " (OUR DIRECTORY)" if is_our_server else ""
+                        results.append(f"✅ Found Java server process: PID {pid} ({name}){marker}")
+                        if cwd:
+                            results.append(f"   └── Running from: {cwd}")
+                else:
+                    results.append("❌ No Java server processes found")
+                    
+            except Exception as e:
+                results.append(f"❌ Error checking processes: {e}")
             
         # Check 2: Port availability (25565)
         try:
@@ -1974,20 +2198,7 @@ class MinecraftServerGUI:
             results.append(f"❌ Server query failed: {e}")
             
         # Check 4: Log file activity
-        if os.path.exists(self.log_file):
-            try:
-                stat = os.stat(self.log_file)
-                mod_time = datetime.fromtimestamp(stat.st_mtime)
-                time_diff = datetime.now() - mod_time
-                
-                if time_diff.seconds < 300:  # Less than 5 minutes
-                    results.append(f"✅ Log file recently active (last update: {mod_time.strftime('%H:%M:%S')})")
-                else:
-                    results.append(f"⚠️ Log file not recently updated (last update: {mod_time.strftime('%H:%M:%S')})")
-            except Exception as e:
-                results.append(f"❌ Error checking log file: {e}")
-        else:
-            results.append(f"❌ Log file not found: {self.log_file}")
+        results.append(self.check_log_activity())
             
         # Determine if we should attempt connection
         can_connect = len(found_server_processes) > 0 and server_responsive
@@ -2010,7 +2221,6 @@ class MinecraftServerGUI:
         if can_connect and not self.server_running:
             # Attempt to connect to the server
             try:
-                import psutil
                 # Prefer server from our directory, or pick the first one
                 our_servers = [s for s in found_processes if s[3]]  # s[3] is is_our_server
                 if our_servers:
@@ -2068,25 +2278,26 @@ class MinecraftServerGUI:
         self.console_output.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] 🔗 Searching for existing server processes...\n")
         if self.console_auto_scroll_var.get():
             self.console_output.see(tk.END)
+        if psutil is None:
+            messagebox.showerror("Error", "psutil library not available for process detection.")
+            return
             
         try:
-            import psutil
             found_servers = []
             
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cwd']):
+            for proc in psutil.process_iter(['pid', 'name']):
                 try:
-                    cmdline = proc.info.get('cmdline', [])
-                    name = proc.info.get('name', '')
-                    cwd = proc.info.get('cwd', '')
+                    name = proc.info.get('name') or ''
                     
-                    if not cmdline:
-                        continue
-                        
-                    # Check if it's a Java process running a server
+                    # Check if it's a Java process running a server; only those get their command line and directory read
                     if 'java' in name.lower():
+                        cmdline = proc.cmdline()
+                        if not cmdline:
+                            continue
                         cmdline_str = ' '.join(cmdline).lower()
                         # Look for server indicators
                         if any(indicator in cmdline_str for indicator in ['server', 'minecraft', 'forge', 'neoforge', 'fabric']):
+                            cwd = process_cwd(proc)
                             # Prefer servers running from our server directory
                             is_our_server = cwd and self.server_dir.lower() in cwd.lower()
                             found_servers.append((proc.info['pid'], name, cwd, is_our_server))
@@ -2152,8 +2363,6 @@ class MinecraftServerGUI:
                     self.console_output.see(tk.END)
                 messagebox.showerror("Connection Error", f"Cannot connect to server process {pid}: {e}")
                 
-        except ImportError:
-            messagebox.showerror("Error", "psutil library not available for process detection.")
         except Exception as e:
             self.console_output.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] ❌ Error searching for servers: {e}\n")
             if self.console_auto_scroll_var.get():
@@ -2260,7 +2469,6 @@ class MinecraftServerGUI:
                 try:
                     # Try to open a new command prompt in the server directory
                     import subprocess
-                    import psutil
                     
                     # Get server working directory
                     try:
@@ -2297,9 +2505,9 @@ class MinecraftServerGUI:
             try:
                 for line in iter(self.server_process.stdout.readline, ''):
                     if line:
-                        self.log_queue.put(('server', line.strip()))
+                        self.log_queue.append(('server', line.strip()))
             except Exception as e:
-                self.log_queue.put(('server', f"Error reading server output: {e}"))
+                self.log_queue.append(('server', f"Error reading server output: {e}"))
                     
     def start_log_monitoring(self):
         """Start monitoring the log file"""
@@ -2313,63 +2521,96 @@ class MinecraftServerGUI:
                 # Go to end of file
                 f.seek(0, 2)
                 
-                while True:
-                    line = f.readline()
-                    if line:
-                        self.log_queue.put(('log', line.strip()))
-                    else:
-                        time.sleep(0.5)
+                # The file position carries over between wakeups, so only new lines are read
+                for _ in self.log_file_changes():
+                    for line in iter(f.readline, ''):
+                        self.log_queue.append(('log', line.strip()))
                         
-    def process_log_queue(self):
-        """Process log messages from queue"""
-        try:
-            # Process server logs
-            while True:
-                source, message = self.log_queue.get_nowait()
-                
-                # Add timestamp if not present
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                
-                if source == 'server':
-                    formatted_message = f"[{timestamp}] {message}\n"
-                    self.console_output.insert(tk.END, formatted_message)
-                    if self.console_auto_scroll_var.get():
-                        self.console_output.see(tk.END)
+    def log_file_changes(self):
+        """Yield each time the log may have changed: on file events when watchfiles is installed, else every 0.5s"""
+        if watch_files is not None:
+            target = os.path.normcase(os.path.abspath(self.log_file))
+            try:
+                for _ in watch_files(os.path.dirname(target), debounce=50, recursive=False,
+                                     watch_filter=lambda change, changed: os.path.normcase(changed) == target):
+                    yield
+                return
+            except Exception as e:
+                print(f"File watching unavailable, polling the log instead: {e}")
+        while True:
+            time.sleep(0.5)
+            yield
                         
-                # Add to log display
-                self.log_display.insert(tk.END, f"[{timestamp}] {message}\n")
-                if self.auto_scroll_var.get():
-                    self.log_display.see(tk.END)
-                
-                # Update player list if join/leave detected
-                self.update_players_from_message(message)
-                
-        except queue.Empty:
-            pass
-            
-        try:
-            # Process bot logs
-            while True:
-                message = self.bot_log_queue.get_nowait()
-                
-                # Add timestamp if not present
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                formatted_message = f"[{timestamp}] {message}\n"
-                
-                # Add to bot log display
-                self.bot_log_display.insert(tk.END, formatted_message)
-                if self.bot_auto_scroll_var.get():
-                    self.bot_log_display.see(tk.END)
+    def process_log_queue(self):
+        """Move queued log messages into the displays, one insert per widget per tick"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        
+        # Process server logs
+        console_lines = []
+        log_lines = []
+        while True:
+            try:
+                source, message = self.log_queue.popleft()
+            except IndexError:
+                break
+            formatted_message = f"[{timestamp}] {message}\n"
+            if source == 'server':
+                console_lines.append(formatted_message)
+            log_lines.append(formatted_message)
+            
+            # Update player list if join/leave detected
+            self.update_players_from_message(message)
+            tps = parse_tps(message)
+            if tps is not None:
+                self.reported_tps = (tps, time.monotonic())
+            
+        if console_lines:
+            follow = self.console_auto_scroll_var.get() and self.at_bottom(self.console_output)
+            self.console_output.insert(tk.END, "".join(console_lines))
+            self.trim_text(self.console_output)
+            if follow:
+                self.console_output.see(tk.END)
+        if log_lines:
+            follow = self.auto_scroll_var.get() and self.at_bottom(self.log_display)
+            self.log_display.insert(tk.END, "".join(log_lines))
+            self.trim_text(self.log_display)
+            if follow:
+                self.log_display.see(tk.END)
+                
+        # Process bot logs
+        bot_messages = []
+        while True:
+            try:
+                bot_messages.append(self.bot_log_queue.popleft())
+            except IndexError:
+                break
+                
+        if bot_messages:
+            # Line the first message will land on, the rest follow one per line
+            follow = self.bot_auto_scroll_var.get() and self.at_bottom(self.bot_log_display)
+            first_line = int(self.bot_log_display.index('end-1c').split('.')[0])
+            self.bot_log_display.insert(tk.END, "".join(m + "\n" for m in bot_messages))  # Raw console lines, like add_bot_console_output
+            if follow:
+                self.bot_log_display.see(tk.END)
                 
-                # Color code different types of bot messages
-                self.colorize_bot_logs(message, len(self.bot_log_display.get(1.0, tk.END).splitlines()) - 1)
+            # Color code different types of bot messages
+            for offset, message in enumerate(bot_messages):
+                self.colorize_bot_logs(message, first_line + offset)
+            self.trim_text(self.bot_log_display)
                 
-        except queue.Empty:
-            pass
-            
         # Schedule next check
-        self.root.after(100, self.process_log_queue)
+        self.root.after(self.log_drain_interval, self.process_log_queue)
+        
+    def at_bottom(self, widget):
+        """True unless the user scrolled up to read older lines"""
+        return widget.yview()[1] > 0.98
         
+    def trim_text(self, widget, max_lines=MAX_LOG_LINES):
+        """Drop the oldest lines so a log widget never holds more than max_lines"""
+        total = int(widget.index('end-1c').split('.')[0])
+        if total > max_lines:
+            widget.delete('1.0', f'{total - max_lines + 1}.0')
+            
     def colorize_bot_logs(self, message, line_num):
         """Add color coding to bot logs based on content"""
         try:
@@ -2398,22 +2639,20 @@ class MinecraftServerGUI:
         
     def update_players_from_message(self, message):
         """Update player list from log messages"""
-        # Simple regex patterns for player join/leave
-        join_pattern = r'(\w+) joined the game'
-        leave_pattern = r'(\w+) left the game'
-        
-        join_match = re.search(join_pattern, message)
-        leave_match = re.search(leave_pattern, message)
+        if " the game" not in message:
+            return  # Nearly every line; the substring test is far cheaper than a regex miss
+        match = PLAYER_EVENT_RE.search(message)
+        if not match:
+            return
+        player, event = match.groups()
         
-        if join_match:
-            player = join_match.group(1)
+        if event == 'joined':
             if player not in self.players_listbox.get(0, tk.END):
                 self.players_listbox.insert(tk.END, player)
                 # Track player join for analytics
                 self.track_player_join(player)
                 
-        elif leave_match:
-            player = leave_match.group(1)
+        else:
             items = list(self.players_listbox.get(0, tk.END))
             if player in items:
                 index = items.index(player)
@@ -2594,39 +2833,42 @@ class MinecraftServerGUI:
         self.start_bot()
         
     def read_bot_output(self):
-        """Read bot console output in separate thread and display directly"""
+        """Read bot console output in separate thread, displayed by process_log_queue"""
+        # Lines go through bot_log_queue like the server's, so a burst costs one Tk insert per tick
+        # instead of one cross-thread after() call per line
         if self.bot_process and hasattr(self.bot_process, 'stdout') and self.bot_process.stdout:
             try:
                 # Add debug message to see if this method is being called
-                self.root.after(0, lambda: self.add_bot_console_output("📡 Bot output reader started"))
+                self.bot_log_queue.append("📡 Bot output reader started")
                 
                 for line in iter(self.bot_process.stdout.readline, ''):
                     if line:
                         # Display the raw console output directly
                         stripped_line = line.rstrip()
                         if stripped_line:  # Only add non-empty lines
-                            # Add line directly to display with newline
-                            self.root.after(0, lambda text=stripped_line: self.add_bot_console_output(text))
+                            self.bot_log_queue.append(stripped_line)
                     else:
                         # If readline returns empty string, process might have ended
                         break
                         
-                self.root.after(0, lambda: self.add_bot_console_output("📡 Bot output reader ended"))
+                self.bot_log_queue.append("📡 Bot output reader ended")
                 
             except Exception as e:
-                self.root.after(0, lambda err=str(e): self.add_bot_console_output(f"❌ Error reading bot output: {err}"))
+                self.bot_log_queue.append(f"❌ Error reading bot output: {e}")
         else:
-            self.root.after(0, lambda: self.add_bot_console_output("⚠️ No bot stdout available for reading"))
+            self.bot_log_queue.append("⚠️ No bot stdout available for reading")
                 
     def add_bot_console_output(self, text):
         """Add bot console output to display (called from main thread)"""
+        follow = self.bot_auto_scroll_var.get() and self.at_bottom(self.bot_log_display)
         self.bot_log_display.insert(tk.END, text + "\n")
-        if self.bot_auto_scroll_var.get():
+        if follow:
             self.bot_log_display.see(tk.END)
         
         # Color code the console output
         line_count = len(self.bot_log_display.get(1.0, tk.END).splitlines()) - 1
         self.colorize_bot_logs(text, line_count)
+        self.trim_text(self.bot_log_display)
         
     def add_bot_gui_message(self, message):
         """Add a GUI message to the bot console with timestamp"""
@@ -2725,24 +2967,49 @@ class MinecraftServerGUI:
             messagebox.showwarning("Bot Not Running", "The Discord bot must be running to force a server check.")
             return
             
+        # Clicks while a check is being sent, or just after one, share that check
+        now = time.monotonic()
+        if self.force_check_in_flight or now - self.last_force_check < 2.0:
+            self.add_bot_gui_message("⏳ A server check was just requested - skipping duplicate")
+            return
+        self.force_check_in_flight = True
+        self.last_force_check = now
+        
         self.add_bot_gui_message("🔍 Forcing immediate server status check...")
+        self.background.submit(self._perform_force_check)
         
+    def _perform_force_check(self):
+        """Wake the bot for a check (background thread)"""
         try:
-            # Create trigger file for the bot to detect
-            trigger_file = os.path.join(self.bot_dir, "force_server_check.trigger")
-            with open(trigger_file, 'w') as f:
-                f.write(f"Force check requested at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-            self.add_bot_gui_message("🔄 Server check triggered - bot will check status within 10 seconds")
-            self.add_bot_gui_message("👀 Watch the bot console for immediate results")
-            messagebox.showinfo("Force Check Triggered", 
-                              "Server status check has been triggered!\n\n" +
-                              "The bot will check server connectivity within 10 seconds.\n" +
-                              "Watch the bot console output for detailed results.")
-                              
+            # Wake the bot over its local socket; the trigger file is only a fallback
+            try:
+                with socket.create_connection(("127.0.0.1", self.force_check_port), timeout=1) as sock:
+                    sock.sendall(b"1")
+                when = "right away"
+            except OSError:
+                trigger_file = os.path.join(self.bot_dir, "force_server_check.trigger")
+                with open(trigger_file, 'w') as f:
+                    f.write(f"Force check requested at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                when = "on its next scheduled check"
+            self.root.after(0, self._display_force_check_result, when, None)
         except Exception as e:
-            self.add_bot_gui_message(f"❌ Failed to trigger server check: {e}")
-            messagebox.showerror("Error", f"Failed to create trigger file: {e}")
+            self.root.after(0, self._display_force_check_result, None, e)
+            
+    def _display_force_check_result(self, when, error):
+        """Report the force check outcome (main thread)"""
+        self.force_check_in_flight = False
+        self.last_force_check = time.monotonic()
+        if error is not None:
+            self.add_bot_gui_message(f"❌ Failed to trigger server check: {error}")
+            messagebox.showerror("Error", f"Failed to trigger server check: {error}")
+            return
+            
+        self.add_bot_gui_message(f"🔄 Server check triggered - bot will check status {when}")
+        self.add_bot_gui_message("👀 Watch the bot console for immediate results")
+        messagebox.showinfo("Force Check Triggered", 
+                          "Server status check has been triggered!\n\n" +
+                          f"The bot will check server connectivity {when}.\n" +
+                          "Watch the bot console output for detailed results.")
         
     def check_existing_processes(self):
         """Check if bot or server processes are already running"""
@@ -2750,7 +3017,6 @@ class MinecraftServerGUI:
         server_pid = self.check_existing_server_process()
         if server_pid:
             try:
-                import psutil
                 existing_process = psutil.Process(server_pid)
                 
                 # Show notification about existing server but don't auto-connect
@@ -2759,7 +3025,7 @@ class MinecraftServerGUI:
                 if hasattr(self, 'console_auto_scroll_var') and self.console_auto_scroll_var.get():
                     self.console_output.see(tk.END)
                     
-            except (ImportError, Exception) as e:
+            except Exception as e:
                 # If we can't access the process, just note it
                 self.console_output.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] 🔍 Detected existing server (PID: {server_pid}) but cannot access it\n")
                 if hasattr(self, 'console_auto_scroll_var') and self.console_auto_scroll_var.get():
@@ -2769,7 +3035,6 @@ class MinecraftServerGUI:
         bot_pid = self.detect_existing_bot()
         if bot_pid:
             try:
-                import psutil
                 existing_bot_process = psutil.Process(bot_pid)
                 
                 # Show notification about existing bot but don't auto-connect
@@ -2777,7 +3042,7 @@ class MinecraftServerGUI:
                 self.bot_log_display.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] 💡 Use '🧹 Kill Running Bots' button to clean up existing processes\n")
                 self.bot_log_display.see(tk.END)
                 
-            except (ImportError, Exception) as e:
+            except Exception as e:
                 # If we can't access the process, just note it
                 self.bot_log_display.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] 🔍 Detected existing bot (PID: {bot_pid}) but cannot access it\n")
                 self.bot_log_display.see(tk.END)
@@ -2788,7 +3053,6 @@ class MinecraftServerGUI:
     def monitor_existing_server(self, process):
         """Monitor an existing server process we connected to"""
         try:
-            import psutil
             # Wait for the process to end
             process.wait()
             # When it ends, update our state
@@ -2928,57 +3192,41 @@ class MinecraftServerGUI:
     
     def check_performance_alerts(self, memory_usage, cpu_usage):
         """Check if performance metrics exceed thresholds and trigger alerts"""
-        current_time = time.time()
-        
-        # Skip if still in cooldown period
-        if current_time - self.last_alert_time < self.alert_cooldown:
-            return
-        
-        alert_triggered = False
+        current_time = time.monotonic()
         alert_messages = []
         
-        # Check memory threshold
-        if memory_usage > self.memory_threshold_mb:
-            alert_messages.append(f"High memory usage: {memory_usage:.1f}MB (threshold: {self.memory_threshold_mb}MB)")
-            alert_triggered = True
-        
-        # Check CPU threshold
-        if cpu_usage > self.cpu_threshold_percent:
-            alert_messages.append(f"High CPU usage: {cpu_usage:.1f}% (threshold: {self.cpu_threshold_percent}%)")
-            alert_triggered = True
+        # Only crossing a threshold alerts (not every sample above it), and the same type at most once per cooldown
+        checks = (
+            ('memory', memory_usage > self.memory_threshold_mb,
+             f"High memory usage: {memory_usage:.1f}MB (threshold: {self.memory_threshold_mb}MB)"),
+            ('cpu', cpu_usage > self.cpu_threshold_percent,
+             f"High CPU usage: {cpu_usage:.1f}% (threshold: {self.cpu_threshold_percent}%)"),
+        )
+        for kind, over, message in checks:
+            if over and not self.alert_over[kind] and current_time - self.last_alert_time[kind] >= self.alert_cooldown:
+                alert_messages.append(message)
+                self.last_alert_time[kind] = current_time
+            self.alert_over[kind] = over
         
-        if alert_triggered:
+        if alert_messages:
             self.trigger_performance_alert(alert_messages)
-            self.last_alert_time = current_time
     
     def trigger_performance_alert(self, messages):
         """Trigger visual and audio performance alerts"""
         try:
             # Play sound alert if enabled
             if hasattr(self, 'alert_sound_var') and self.alert_sound_var.get():
-                try:
-                    import winsound
-                    winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
-                except Exception as e:
-                    print(f"Sound alert failed: {e}")
+                self.alert_sound_pending.set()
             
             # Show non-intrusive notification in the analytics display
             alert_text = "⚠️ PERFORMANCE ALERT ⚠️\n" + "\n".join(messages)
             
             # Visual alert: Change label colors to red temporarily
             if hasattr(self, 'memory_label'):
-                original_color = self.memory_label.cget('fg')
-                self.memory_label.config(fg='#ff6b6b')  # Red text
-                
-                # Reset color after 3 seconds
-                self.root.after(3000, lambda: self.memory_label.config(fg=original_color))
+                self.flash_label(self.memory_label)
             
             if hasattr(self, 'cpu_label'):
-                original_color = self.cpu_label.cget('fg')
-                self.cpu_label.config(fg='#ff6b6b')  # Red text
-                
-                # Reset color after 3 seconds
-                self.root.after(3000, lambda: self.cpu_label.config(fg=original_color))
+                self.flash_label(self.cpu_label)
             
             # Flash the notebook tab by changing its text temporarily
             try:
@@ -3008,6 +3256,29 @@ class MinecraftServerGUI:
             except:
                 print(f"Fallback alert: {'; '.join(messages)}")
     
+    def flash_label(self, label, color='#ff6b6b'):
+        """Turn a label red for 3 seconds, then put its color back"""
+        key = str(label)
+        if key in self.flashing:
+            return  # Already red, the running flash restores it
+        self.flashing[key] = label.cget('fg')
+        label.config(fg=color)
+        
+        def restore():
+            label.config(fg=self.flashing.pop(key))  # The color _set_label asked for most recently
+        self.root.after(3000, restore)
+        
+    def alert_sound_worker(self):
+        """Play alert sounds off the Tk thread; requests within a second of a beep share it"""
+        while True:
+            self.alert_sound_pending.wait()
+            self.alert_sound_pending.clear()
+            try:
+                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+            except Exception as e:
+                print(f"Sound alert failed: {e}")
+            time.sleep(1.0)
+            
     def test_performance_alert(self):
         """Test the performance alert system with simulated high values"""
         test_messages = [